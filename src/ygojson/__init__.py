@@ -1,5 +1,9 @@
 from .database import *
+from .frozen import FrozenDatabase, freeze
+from .graph import Graph, GraphNodeKind, build_graph
 from .importers.yamlyugi import import_from_yaml_yugi
 from .importers.ygoprodeck import import_from_ygoprodeck
 from .importers.yugipedia import generate_yugipedia_partitions, import_from_yugipedia
+from .memory import MemoryUsage, format_memory_usage, memory_usage
 from .version import __version__
+from .ydk import *
@@ -99,7 +99,7 @@ def main(argv: typing.Optional[typing.List[str]] = None) -> int:
     parser.add_argument(
         "--no-regen-backlinks",
         action="store_true",
-        help="Don't regenerate backlinks (for example, links from cards to sets)",
+        help="Deprecated; backlinks (for example, links from cards to sets) are now kept up to date as things are added",
     )
     parser.add_argument(
         "--no-manual",
@@ -156,6 +156,11 @@ def main(argv: typing.Optional[typing.List[str]] = None) -> int:
         metavar="PATH",
         help="Parse Yugipedia from a partition file rather than all at once (empty string to disable)",
     )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Print how much memory the database uses, by type and field, before saving",
+    )
     parser.add_argument(
         "--yugipedia-pages",
         type=str,
@@ -242,9 +247,9 @@ def main(argv: typing.Optional[typing.List[str]] = None) -> int:
             )
             logging.info(f"Added {n_new} objects and updated {n_old} objects.")
 
-    if not args.no_regen_backlinks:
-        logging.info("Regenerating backlinks...")
-        db.regenerate_backlinks()
+    logging.info("Interning strings...")
+    n = db.intern_strings()
+    logging.info(f"Freed about {n} bytes of duplicate strings.")
 
     if not args.no_manual:
         logging.info("Running manual fixups...")
@@ -264,6 +269,10 @@ def main(argv: typing.Optional[typing.List[str]] = None) -> int:
     logging.info("Cleaning database...")
     db.deduplicate()
 
+    if args.memory_report:
+        logging.info("Measuring memory usage...")
+        print(format_memory_usage(memory_usage(db)))
+
     logging.info("Saving database...")
     db.save(
         generate_individuals=not args.no_individuals,
@@ -1,12 +1,21 @@
+import array
+import bisect
+import collections
+import contextlib
 import datetime
 import enum
+import functools
 import json
 import logging
 import os
 import os.path
+import sys
+import threading
 import typing
+import unicodedata
 import uuid
 import zipfile
+import zlib
 
 import requests
 import tqdm
@@ -96,6 +105,8 @@ MANUAL_DISTROS_DIR = os.path.join(MANUAL_DATA_DIR, "distributions")
 MANUAL_PRODUCTS_DIR = os.path.join(MANUAL_DATA_DIR, "sealed-products")
 """The directory containing manual sealed product fixup data."""
 
+_T = typing.TypeVar("_T")
+
 
 class CardType(enum.Enum):
     """The overarching type of :class:`Card`: Monster, spell, trap, etc."""
@@ -264,12 +275,22 @@ class Format(enum.Enum):
         """Returns any child formats of this format.
         Cards printed in a child format are also considered printed in parent formats.
         """
-        return [k for k, v in FORMAT_PARENTS.items() if v == self]
+        return _FORMAT_SUBFORMATS[self]
+
+    @property
+    def ancestors(self) -> typing.Iterable["Format"]:
+        """Returns the parent of this format, the parent of that, and so on."""
+        return _FORMAT_ANCESTORS[self]
+
+    @property
+    def descendants(self) -> typing.Iterable["Format"]:
+        """Returns the subformats of this format, their subformats, and so on."""
+        return _FORMAT_DESCENDANTS[self]
 
     @property
     def locales(self) -> typing.Iterable["Locale"]:
         """Returns all locales that print cards into this format."""
-        return [k for k, v in LOCALE_FORMATS.items() if self in v]
+        return _FORMAT_LOCALES[self]
 
 
 FORMAT_PARENTS = {
@@ -313,7 +334,7 @@ class Language(enum.Enum):
     @property
     def locales(self) -> typing.Iterable["Locale"]:
         """Returns the locales cards of this language are printed in by default."""
-        return [k for k, v in LOCALE_LANGS.items() if self == v]
+        return _LANGUAGE_LOCALES[self]
 
 
 class Locale(enum.Enum):
@@ -359,7 +380,17 @@ class Locale(enum.Enum):
     @property
     def sublocales(self) -> typing.Iterable["Locale"]:
         """Get the child locales. Some locales are part of a larger locale; for example, 'na' being part of 'en'."""
-        return [k for k, v in LOCALE_PARENTS.items() if self == v]
+        return _LOCALE_SUBLOCALES[self]
+
+    @property
+    def ancestors(self) -> typing.Iterable["Locale"]:
+        """Get the parent of this locale, the parent of that, and so on."""
+        return _LOCALE_ANCESTORS[self]
+
+    @property
+    def descendants(self) -> typing.Iterable["Locale"]:
+        """Get the sublocales of this locale, their sublocales, and so on."""
+        return _LOCALE_DESCENDANTS[self]
 
     @property
     def language(self) -> Language:
@@ -369,13 +400,7 @@ class Locale(enum.Enum):
     @property
     def formats(self) -> typing.Iterable[Format]:
         """Return a list of possible formats that this locale prints cards into."""
-        if self not in LOCALE_FORMATS:
-            parent = self.parent
-            if parent:
-                return parent.formats
-            else:
-                return []
-        return LOCALE_FORMATS[self]
+        return _LOCALE_FORMATS[self]
 
 
 LOCALE_PARENTS = {
@@ -420,6 +445,129 @@ LOCALE_FORMATS = {
 }
 
 
+def _hierarchy_closure(
+    members: typing.Iterable[_T], parents: typing.Dict[_T, _T]
+) -> typing.Tuple[
+    typing.Dict[_T, typing.Tuple[_T, ...]],
+    typing.Dict[_T, typing.Tuple[_T, ...]],
+    typing.Dict[_T, typing.Tuple[_T, ...]],
+]:
+    """Precomputes the children, ancestors, and descendants of every member of a hierarchy."""
+
+    children: typing.Dict[_T, typing.List[_T]] = {k: [] for k in members}
+    ancestors: typing.Dict[_T, typing.List[_T]] = {k: [] for k in members}
+    descendants: typing.Dict[_T, typing.List[_T]] = {k: [] for k in members}
+    for member in children:
+        if member in parents:
+            children[parents[member]].append(member)
+        parent = parents.get(member)
+        while parent is not None:
+            ancestors[member].append(parent)
+            descendants[parent].append(member)
+            parent = parents.get(parent)
+    return (
+        {k: tuple(v) for k, v in children.items()},
+        {k: tuple(v) for k, v in ancestors.items()},
+        {k: tuple(v) for k, v in descendants.items()},
+    )
+
+
+_FORMAT_SUBFORMATS, _FORMAT_ANCESTORS, _FORMAT_DESCENDANTS = _hierarchy_closure(
+    Format, FORMAT_PARENTS
+)
+_LOCALE_SUBLOCALES, _LOCALE_ANCESTORS, _LOCALE_DESCENDANTS = _hierarchy_closure(
+    Locale, LOCALE_PARENTS
+)
+_FORMAT_LOCALES: typing.Dict[Format, typing.Tuple[Locale, ...]] = {
+    format: tuple(k for k, v in LOCALE_FORMATS.items() if format in v)
+    for format in Format
+}
+_LOCALE_FORMATS: typing.Dict[Locale, typing.Tuple[Format, ...]] = {
+    locale: tuple(
+        next(
+            (
+                LOCALE_FORMATS[x]
+                for x in (locale, *_LOCALE_ANCESTORS[locale])
+                if x in LOCALE_FORMATS
+            ),
+            [],
+        )
+    )
+    for locale in Locale
+}
+_LANGUAGE_LOCALES: typing.Dict[Language, typing.Tuple[Locale, ...]] = {
+    language: tuple(k for k, v in LOCALE_LANGS.items() if language == v)
+    for language in Language
+}
+
+_KEPT_COMBINING_MARKS = {
+    "\u3099",  # combining katakana-hiragana voiced sound mark (dakuten)
+    "\u309a",  # combining katakana-hiragana semi-voiced sound mark (handakuten)
+}
+
+
+def normalize_name(name: str) -> str:
+    """Normalizes a name for use as a lookup key in any language.
+
+    Full-width and half-width characters are unified, case is folded, and diacritics are removed.
+    Japanese voiced sound marks are kept, as they distinguish different kana.
+    """
+
+    decomposed = unicodedata.normalize(
+        "NFD", unicodedata.normalize("NFKC", name.strip()).casefold()
+    )
+    return unicodedata.normalize(
+        "NFC",
+        "".join(
+            c
+            for c in decomposed
+            if c in _KEPT_COMBINING_MARKS or not unicodedata.combining(c)
+        ),
+    )
+
+
+def update_field(thing: typing.Any, field: str, value: typing.Any) -> bool:
+    """Sets a field of an object, but only if the new value is different from the old one.
+    Importers use this to leave unchanged objects alone, and to know if they changed anything.
+
+    :return: True if the field was changed.
+    """
+
+    if getattr(thing, field) == value:
+        return False
+    setattr(thing, field, value)
+    return True
+
+
+def update_card_text(
+    card: "Card",
+    language: Language,
+    *,
+    name: typing.Optional[str] = None,
+    effect: typing.Optional[str] = None,
+    pendulum_effect: typing.Optional[str] = None,
+) -> bool:
+    """Updates a card's text in a language, creating it if the card has no text in that language yet.
+    Fields given as None are left as they are; if a new text is created, it must be given a name.
+
+    :return: True if the card's text was changed.
+    """
+
+    text = card.text.get(language)
+    if text is None:
+        if name is None:
+            raise ValueError(f"Card {card.id} has no text in {language}")
+        text = card.text[language] = CardText(name=name)
+        changed = True
+    else:
+        changed = name is not None and update_field(text, "name", name)
+    if effect is not None:
+        changed = update_field(text, "effect", effect) or changed
+    if pendulum_effect is not None:
+        changed = update_field(text, "pendulum_effect", pendulum_effect) or changed
+    return changed
+
+
 class VideoGameRaity(enum.Enum):
     """The rarity of a :class:`Card` in Master Duel and/or Duel Links."""
 
@@ -583,17 +731,142 @@ class CardRarity(enum.Enum):
     """Millenium Gold Rare."""
 
 
+_E = typing.TypeVar("_E", bound=enum.Enum)
+
+
+class EnumCodes(typing.Generic[_E]):
+    """Encodes the members of an enum as small integers, for storing in compact arrays
+    such as `LegalityHistory.legalities`, and for vectorized queries over them.
+    0 stands for None; members are numbered from 1, in the order they are declared.
+    Codes may change between versions of YGOJSON, so save enum values instead.
+    """
+
+    __slots__ = (
+        "members",
+        "codes",
+    )
+
+    TYPECODE: typing.ClassVar[str] = "B"
+    """The ``array`` type code that can hold every code."""
+
+    members: typing.Tuple[typing.Optional[_E], ...]
+    """The member each code stands for."""
+
+    codes: typing.Dict[typing.Optional[_E], int]
+    """The code of each member."""
+
+    def __init__(self, enum_: typing.Type[_E]) -> None:
+        self.members = (None, *enum_)
+        self.codes = {x: i for i, x in enumerate(self.members)}
+        if len(self.members) > 256:
+            raise ValueError(f"Too many members in {enum_.__name__} to encode")
+
+    def encode(self, member: typing.Optional[_E]) -> int:
+        """Gets the code of a member, or 0 for None."""
+        return self.codes[member]
+
+    def decode(self, code: int) -> typing.Optional[_E]:
+        """Gets the member a code stands for, or None for 0."""
+        return self.members[code]
+
+    def encode_all(
+        self, members: typing.Iterable[typing.Optional[_E]] = ()
+    ) -> array.array:
+        """Makes an ``array`` of the codes of some members."""
+        return array.array(EnumCodes.TYPECODE, (self.codes[x] for x in members))
+
+
+LEGALITY_CODES = EnumCodes(Legality)
+"""Small integer codes for `Legality`."""
+
+
+COMPRESS_TEXT_OVER: typing.Optional[int] = 256
+"""Card effect text at least this many bytes long is kept zlib-compressed in memory
+until it is read. Set to None to never compress effect text.
+
+Text is only ever packed when that makes it smaller than the string itself.
+UTF-8 takes 3 bytes for most Japanese, Korean, and Chinese characters, where a string takes 2,
+and zlib gains little on short texts in those locales, so those are usually kept as strings.
+"""
+
+
+def _pack_text(
+    text: typing.Optional[str],
+) -> typing.Tuple[typing.Union[str, bytes, None], bool]:
+    if text is None:
+        return None, False
+    packed: typing.Union[str, bytes] = text
+    compressed = False
+    encoded = text.encode("utf-8")
+    if sys.getsizeof(encoded) < sys.getsizeof(packed):
+        packed = encoded
+    if COMPRESS_TEXT_OVER is not None and len(encoded) >= COMPRESS_TEXT_OVER:
+        zipped = zlib.compress(encoded)
+        if sys.getsizeof(zipped) < sys.getsizeof(packed):
+            packed, compressed = zipped, True
+    return packed, compressed
+
+
+def _unpack_text(
+    packed: typing.Union[str, bytes, None], compressed: bool
+) -> typing.Optional[str]:
+    if packed is None or isinstance(packed, str):
+        return packed
+    if compressed:
+        packed = zlib.decompress(packed)
+    return packed.decode("utf-8")
+
+
 class CardText:
     """Localized text that appears on a :class:`Card`."""
 
+    __slots__ = (
+        "name",
+        "_effect",
+        "_pendulum_effect",
+        "_compressed",
+        "official",
+    )
+
+    _EFFECT_COMPRESSED: typing.ClassVar[int] = 1
+    _PENDULUM_EFFECT_COMPRESSED: typing.ClassVar[int] = 2
+
     name: str
     """The name of this card in this locale."""
 
-    effect: typing.Optional[str]
-    """The effect text or lore of this card in this locale."""
+    _effect: typing.Union[str, bytes, None]
+    _pendulum_effect: typing.Union[str, bytes, None]
+    _compressed: int
+    """Which of the effect texts are compressed; see `COMPRESS_TEXT_OVER`."""
+
+    @property
+    def effect(self) -> typing.Optional[str]:
+        """The effect text or lore of this card in this locale."""
+        return _unpack_text(
+            self._effect, bool(self._compressed & CardText._EFFECT_COMPRESSED)
+        )
+
+    @effect.setter
+    def effect(self, value: typing.Optional[str]):
+        self._effect, compressed = _pack_text(value)
+        self._compressed = (self._compressed & ~CardText._EFFECT_COMPRESSED) | (
+            CardText._EFFECT_COMPRESSED if compressed else 0
+        )
 
-    pendulum_effect: typing.Optional[str]
-    """The upper box's effect text of this card in this locale. Only applicable to pendulum cards."""
+    @property
+    def pendulum_effect(self) -> typing.Optional[str]:
+        """The upper box's effect text of this card in this locale. Only applicable to pendulum cards."""
+        return _unpack_text(
+            self._pendulum_effect,
+            bool(self._compressed & CardText._PENDULUM_EFFECT_COMPRESSED),
+        )
+
+    @pendulum_effect.setter
+    def pendulum_effect(self, value: typing.Optional[str]):
+        self._pendulum_effect, compressed = _pack_text(value)
+        self._compressed = (
+            self._compressed & ~CardText._PENDULUM_EFFECT_COMPRESSED
+        ) | (CardText._PENDULUM_EFFECT_COMPRESSED if compressed else 0)
 
     official: bool
     """Whether or not this localization is official."""
@@ -607,6 +880,7 @@ class CardText:
         official: bool = True,
     ):
         self.name = name
+        self._compressed = 0
         self.effect = effect
         self.pendulum_effect = pendulum_effect
         self.official = official
@@ -618,6 +892,13 @@ class CardImage:
     this is for tracking when cards have multiple art treatments across multiple printings!
     """
 
+    __slots__ = (
+        "id",
+        "password",
+        "crop_art",
+        "card_art",
+    )
+
     id: uuid.UUID
     """The UUID of this card's art treatment."""
 
@@ -650,6 +931,12 @@ class CardImage:
 class LegalityPeriod:
     """A period of time in which a :class:`Card` was of a certain :class:`Legality`."""
 
+    __slots__ = (
+        "legality",
+        "points",
+        "date",
+    )
+
     legality: Legality
     """The legality of the card."""
 
@@ -671,9 +958,141 @@ class LegalityPeriod:
         self.date = date
 
 
+class LegalityHistory(typing.MutableSequence[LegalityPeriod]):
+    """The history of a :class:`Card`'s legality in a format, stored as packed arrays.
+    This acts like a list of :class:`LegalityPeriod`s, but the periods it gives out are copies;
+    to change a period, assign a new one in its place.
+    """
+
+    __slots__ = (
+        "ordinals",
+        "legalities",
+        "points",
+        "_sorted_index",
+    )
+
+    ordinals: array.array
+    """The date each period came into effect, as a proleptic Gregorian ordinal. Do not modify."""
+
+    legalities: array.array
+    """The legality of each period, encoded with `LEGALITY_CODES`. Do not modify."""
+
+    points: array.array
+    """The point value of each period, or NaN if it has none. Do not modify."""
+
+    _sorted_index: typing.Optional[
+        typing.Tuple[typing.Sequence[int], typing.Optional[typing.List[int]]]
+    ]
+    """The ordinals in date order, and the order of the periods if they are not already in date order.
+    None if it needs to be regenerated.
+    """
+
+    def __init__(self, periods: typing.Iterable[LegalityPeriod] = ()) -> None:
+        self.ordinals = array.array("l")
+        self.legalities = LEGALITY_CODES.encode_all()
+        self.points = array.array("d")
+        self._sorted_index = None
+        for period in periods:
+            self.append(period)
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def _period(self, i: int) -> LegalityPeriod:
+        raw_points = self.points[i]
+        points: typing.Optional[float] = None
+        if raw_points == raw_points:  # NaN means no points
+            points = int(raw_points) if raw_points.is_integer() else raw_points
+        return LegalityPeriod(
+            legality=LEGALITY_CODES.decode(self.legalities[i]),
+            points=points,
+            date=datetime.date.fromordinal(self.ordinals[i]),
+        )
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._period(j) for j in range(len(self))[i]]
+        return self._period(range(len(self))[i])
+
+    def __iter__(self) -> typing.Iterator[LegalityPeriod]:
+        for i in range(len(self)):
+            yield self._period(i)
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            periods = [*self]
+            periods[i] = value
+            self.clear()
+            self.extend(periods)
+            return
+        i = range(len(self))[i]
+        self.ordinals[i] = value.date.toordinal()
+        self.legalities[i] = LEGALITY_CODES.encode(value.legality)
+        self.points[i] = float("nan") if value.points is None else value.points
+        self._sorted_index = None
+
+    def __delitem__(self, i):
+        if isinstance(i, slice):
+            periods = [*self]
+            del periods[i]
+            self.clear()
+            self.extend(periods)
+            return
+        del self.ordinals[i]
+        del self.legalities[i]
+        del self.points[i]
+        self._sorted_index = None
+
+    def insert(self, i: int, value: LegalityPeriod):
+        ordinal = value.date.toordinal()
+        still_sorted = (
+            i >= len(self)
+            and self._sorted_index is not None
+            and self._sorted_index[1] is None
+            and (not self.ordinals or self.ordinals[-1] <= ordinal)
+        )
+        if not still_sorted:
+            self._sorted_index = None
+        self.ordinals.insert(i, ordinal)
+        self.legalities.insert(i, LEGALITY_CODES.encode(value.legality))
+        self.points.insert(i, float("nan") if value.points is None else value.points)
+
+    def clear(self):
+        del self.ordinals[:]
+        del self.legalities[:]
+        del self.points[:]
+        self._sorted_index = None
+
+    def index_at(self, ordinal: int) -> typing.Optional[int]:
+        """Finds the period in effect on a date, given as a proleptic Gregorian ordinal.
+        If more than one period starts on that date, the last one given wins.
+
+        :return: The index of the period, or None if the date is before the first period.
+        """
+
+        if self._sorted_index is None:
+            order = sorted(range(len(self)), key=self.ordinals.__getitem__)
+            if all(i == j for i, j in enumerate(order)):
+                self._sorted_index = (self.ordinals, None)
+            else:
+                self._sorted_index = ([self.ordinals[i] for i in order], order)
+
+        ordinals, order = self._sorted_index
+        i = bisect.bisect_right(ordinals, ordinal)
+        if i == 0:
+            return None
+        return order[i - 1] if order else i - 1
+
+
 class CardLegality:
     """Current and historical legality information for a :class:`Card`."""
 
+    __slots__ = (
+        "legality",
+        "points",
+        "_history",
+    )
+
     @property
     def current(self):
         """Deprecated; use ``legality`` instead."""
@@ -696,8 +1115,16 @@ class CardLegality:
     prefer this when you need to see the current legality, rather than looking up history.
     """
 
-    history: typing.List[LegalityPeriod]
-    """The history of limitations and unlimiations for this card."""
+    _history: LegalityHistory
+
+    @property
+    def history(self) -> LegalityHistory:
+        """The history of limitations and unlimiations for this card."""
+        return self._history
+
+    @history.setter
+    def history(self, value: typing.Iterable[LegalityPeriod]):
+        self._history = LegalityHistory(value)
 
     def __init__(
         self,
@@ -705,16 +1132,28 @@ class CardLegality:
         current: typing.Optional[Legality] = None,
         legality: typing.Optional[Legality] = None,
         points: typing.Optional[float] = None,
-        history: typing.Optional[typing.List[LegalityPeriod]] = None,
+        history: typing.Optional[typing.Iterable[LegalityPeriod]] = None,
     ):
         self.legality = legality or current or Legality.UNLIMITED
         self.points = points
-        self.history = history or []
+        self.history = history or ()
+
+
+_LEGALITY_BEFORE_HISTORY = CardLegality(legality=Legality.UNLIMITED)
+"""The legality of a card in a format before the first period of its history there."""
+
+_POINTS_BEFORE_HISTORY = CardLegality(legality=Legality.UNLIMITED, points=0)
+"""Like `_LEGALITY_BEFORE_HISTORY`, but for formats that use points."""
 
 
 class ExternalIdPair:
     """A name and ID pair, used on sites like Yugipedia and (occasionally) YGOPRODECK."""
 
+    __slots__ = (
+        "name",
+        "id",
+    )
+
     name: str
     id: int
 
@@ -723,9 +1162,101 @@ class ExternalIdPair:
         self.id = id
 
 
+class Backlinks(typing.MutableSet[_T]):
+    """The things that contain something, in the order they were first added, without duplicates.
+    Each thing also has a count of how many times it was added,
+    such as how many printings of a card a set has.
+    """
+
+    __slots__ = ("_counts",)
+
+    _counts: typing.Dict[_T, int]
+
+    def __init__(self, things: typing.Iterable[_T] = ()) -> None:
+        self._counts = {}
+        for thing in things:
+            self.add(thing)
+
+    def __contains__(self, thing: object) -> bool:
+        return thing in self._counts
+
+    def __iter__(self) -> typing.Iterator[_T]:
+        return iter(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __repr__(self) -> str:
+        return f"Backlinks({[*self._counts]!r})"
+
+    def add(self, thing: _T, n: int = 1):
+        """Adds a thing, or increases its count if it is already present."""
+        self._counts[thing] = self._counts.get(thing, 0) + n
+
+    def append(self, thing: _T):
+        """The same as `Backlinks.add`."""
+        self.add(thing)
+
+    def discard(self, thing: _T):
+        """Removes a thing entirely, whatever its count."""
+        self._counts.pop(thing, None)
+
+    def subtract(self, thing: _T, n: int = 1):
+        """Decreases the count of a thing, removing it if its count drops to 0."""
+        count = self._counts.get(thing, 0) - n
+        if count > 0:
+            self._counts[thing] = count
+        else:
+            self._counts.pop(thing, None)
+
+    def clear(self):
+        self._counts.clear()
+
+    def count(self, thing: _T) -> int:
+        """How many times a thing was added. 0 if it is not present."""
+        return self._counts.get(thing, 0)
+
+    def items(self) -> typing.Iterable[typing.Tuple[_T, int]]:
+        """Each thing, and how many times it was added."""
+        return self._counts.items()
+
+
 class Card:
     """A single Yugioh card or token. For information on printings of a card, see :class:`CardPrinting`."""
 
+    __slots__ = (
+        "id",
+        "text",
+        "card_type",
+        "attribute",
+        "monster_card_types",
+        "type",
+        "classifications",
+        "abilities",
+        "level",
+        "rank",
+        "atk",
+        "def_",
+        "scale",
+        "link_arrows",
+        "subcategory",
+        "character",
+        "skill_type",
+        "passwords",
+        "images",
+        "_sets",
+        "illegal",
+        "legality",
+        "master_duel_rarity",
+        "master_duel_craftable",
+        "duel_links_rarity",
+        "yugipedia_pages",
+        "db_id",
+        "ygoprodeck",
+        "yamlyugi_id",
+        "_series",
+    )
+
     id: uuid.UUID
     """The UUID of the card."""
 
@@ -785,8 +1316,18 @@ class Card:
     images: typing.List[CardImage]
     """All art treatments this card has been known to have been printed with."""
 
-    sets: typing.List["Set"]
-    """Sets in which this card has appeared."""
+    _sets: Backlinks["Set"]
+
+    @property
+    def sets(self) -> Backlinks["Set"]:
+        """Sets in which this card has appeared.
+        Use ``sets.count(set_)`` to get how many printings of this card a set has.
+        """
+        return self._sets
+
+    @sets.setter
+    def sets(self, value: typing.Iterable["Set"]):
+        self._sets = Backlinks(value)
 
     illegal: bool
     """True if this card has been declared illegal in all formats.
@@ -817,8 +1358,16 @@ class Card:
     yamlyugi_id: typing.Optional[int]
     """The Yaml Yugi page you can find this card on."""
 
-    series: typing.List["Series"]
-    """Any series or archetypes this card belongs to."""
+    _series: Backlinks["Series"]
+
+    @property
+    def series(self) -> Backlinks["Series"]:
+        """Any series or archetypes this card belongs to."""
+        return self._series
+
+    @series.setter
+    def series(self, value: typing.Iterable["Series"]):
+        self._series = Backlinks(value)
 
     def __init__(
         self,
@@ -842,7 +1391,7 @@ class Card:
         skill_type: typing.Optional[str] = None,
         passwords: typing.Optional[typing.List[str]] = None,
         images: typing.Optional[typing.List[CardImage]] = None,
-        sets: typing.Optional[typing.List["Set"]] = None,
+        sets: typing.Optional[typing.Iterable["Set"]] = None,
         illegal: bool = False,
         legality: typing.Optional[typing.Dict[Format, CardLegality]] = None,
         master_duel_rarity: typing.Optional[VideoGameRaity] = None,
@@ -852,7 +1401,7 @@ class Card:
         db_id: typing.Optional[int] = None,
         ygoprodeck: typing.Optional[ExternalIdPair] = None,
         yamlyugi_id: typing.Optional[int] = None,
-        series: typing.Optional[typing.List["Series"]] = None,
+        series: typing.Optional[typing.Iterable["Series"]] = None,
     ):
         self.id = id
         self.text = text or {}
@@ -873,7 +1422,7 @@ class Card:
         self.skill_type = skill_type
         self.passwords = passwords or []
         self.images = images or []
-        self.sets = sets or []
+        self.sets = sets or ()
         self.illegal = illegal
         self.legality = legality or {}
         self.master_duel_rarity = master_duel_rarity
@@ -883,7 +1432,7 @@ class Card:
         self.db_id = db_id
         self.ygoprodeck = ygoprodeck
         self.yamlyugi_id = yamlyugi_id
-        self.series = series or []
+        self.series = series or ()
 
     def _to_json(self) -> typing.Dict[str, typing.Any]:
         return {
@@ -933,7 +1482,7 @@ class Card:
             **({"character": self.character} if self.character is not None else {}),
             **({"skillType": self.skill_type} if self.skill_type is not None else {}),
             **({"subcategory": self.subcategory.value} if self.subcategory else {}),
-            "passwords": self.passwords,
+            "passwords": [*self.passwords],
             "images": [
                 {
                     "id": str(x.id),
@@ -1022,6 +1571,11 @@ class Card:
 class PackDistroWeight:
     """A probability of finding a certain rarity of card."""
 
+    __slots__ = (
+        "rarities",
+        "chance",
+    )
+
     rarities: typing.List[CardRarity]
     """The rarities to draw from. If empty, draws from all rarities."""
 
@@ -1323,7 +1877,7 @@ class SealedProductLocale:
                 else {}
             ),
             "externalIDs": {
-                **({"dbIDs": self.db_ids} if self.db_ids else {}),
+                **({"dbIDs": [*self.db_ids]} if self.db_ids else {}),
             },
         }
 
@@ -1519,6 +2073,18 @@ class Series:
 class CardPrinting:
     """A single printing of a :class:`Card` in a :class:`Set`."""
 
+    __slots__ = (
+        "id",
+        "card",
+        "suffix",
+        "rarity",
+        "only_in_box",
+        "language",
+        "image",
+        "replica",
+        "qty",
+    )
+
     id: uuid.UUID
     """The UUID of this printing."""
 
@@ -1601,6 +2167,20 @@ class CardPrinting:
 class SetContents:
     """The contents of a :class:`Set` across a given list of :class:`SetLocale`s."""
 
+    __slots__ = (
+        "locales",
+        "formats",
+        "distrobution",
+        "packs_per_box",
+        "has_hobby_retail_differences",
+        "editions",
+        "image",
+        "box_image",
+        "cards",
+        "removed_cards",
+        "ygoprodeck",
+    )
+
     locales: typing.List["SetLocale"]
     """The locales in which this product has these contents.
     May be empty in the case of video-game-only products.
@@ -1732,6 +2312,20 @@ class SetContents:
 class SetLocale:
     """A locale in which a :class:`Set` was released."""
 
+    __slots__ = (
+        "key",
+        "language",
+        "prefix",
+        "date",
+        "image",
+        "box_image",
+        "card_images",
+        "card_prices",
+        "db_ids",
+        "formats",
+        "editions",
+    )
+
     key: Locale
     """The locale code."""
 
@@ -1842,7 +2436,7 @@ class SetLocale:
             **({"formats": [x.value for x in self.formats]} if self.formats else {}),
             **({"editions": [x.value for x in self.editions]} if self.editions else {}),
             "externalIDs": {
-                **({"dbIDs": self.db_ids} if self.db_ids else {}),
+                **({"dbIDs": [*self.db_ids]} if self.db_ids else {}),
             },
         }
 
@@ -1914,6 +2508,102 @@ class Set:
         }
 
 
+class PrintingLocation:
+    """Where a :class:`CardPrinting` can be found: the set and contents it was printed in.
+    See `Database.printings_by_card`.
+    """
+
+    __slots__ = (
+        "printing",
+        "set",
+        "contents",
+        "removed",
+    )
+
+    printing: CardPrinting
+    """The printing."""
+
+    set: Set
+    """The set the printing is in."""
+
+    contents: SetContents
+    """The contents of the set the printing is in."""
+
+    removed: bool
+    """True if the printing is one of the set's `SetContents.removed_cards`."""
+
+    def __init__(
+        self,
+        *,
+        printing: CardPrinting,
+        set: Set,
+        contents: SetContents,
+        removed: bool = False,
+    ) -> None:
+        self.printing = printing
+        self.set = set
+        self.contents = contents
+        self.removed = removed
+
+    @property
+    def locales(self) -> typing.List[SetLocale]:
+        """The locales the printing was printed in. Empty for video-game-only sets, which have no locales."""
+        return self.contents.locales
+
+    @property
+    def rarity(self) -> typing.Optional[CardRarity]:
+        """The rarity of the printing, if known."""
+        return self.printing.rarity
+
+    def editions(self, locale: typing.Optional[SetLocale]) -> typing.List[SetEdition]:
+        """The editions the printing was released in, in one of its locales."""
+        if locale and locale.editions:
+            return locale.editions
+        return self.contents.editions
+
+    def code(self, locale: SetLocale) -> typing.Optional[str]:
+        """The full set code of the printing in one of its locales, if it has one."""
+        if locale.prefix and self.printing.suffix:
+            return locale.prefix + self.printing.suffix
+        return None
+
+
+class SetRelease(typing.NamedTuple):
+    """A release of a :class:`Set`, as found by `Database.sets_released_between`."""
+
+    date: datetime.date
+    """The date of the release."""
+
+    set: Set
+    """The set released."""
+
+    locale: typing.Optional[SetLocale]
+    """The locale the set was released in. None for video-game-only sets."""
+
+
+class ProductRelease(typing.NamedTuple):
+    """A release of a :class:`SealedProduct`, as found by `Database.products_released_between`."""
+
+    date: datetime.date
+    """The date of the release."""
+
+    product: SealedProduct
+    """The product released."""
+
+    locale: typing.Optional[SealedProductLocale]
+    """The locale the product was released in. None for video-game-only products."""
+
+
+class ResolvedIdentifier(typing.NamedTuple):
+    """What an identifier passed to `Database.resolve_identifiers` refers to."""
+
+    card: typing.Optional[Card]
+    """The card identified, or None if nothing matched."""
+
+    printings: typing.List[CardPrinting]
+    """The printings identified, if the identifier was a set code. Empty otherwise."""
+
+
 class ManualFixupIdentifier:
     """A Manual Fixup Idenfier, or MFI, helps label and locate various things when manually fixing up data.
     See manual-data/README.md in this module's repository for details.
@@ -2031,6 +2721,58 @@ class ManualFixupIdentifier:
     def __str__(self) -> str:
         return json.dumps(self.to_json())
 
+    def _cache_key(self) -> typing.Tuple[typing.Any, ...]:
+        return (
+            self.id,
+            self.name,
+            self.konami_id,
+            self.ygoprodeck_id,
+            self.ygoprodeck_name,
+            self.yugipedia_id,
+            self.yugipedia_name,
+            self.yamlyugi,
+            self.set._cache_key() if self.set else None,
+            self.locale,
+            self.edition,
+            self.rarity,
+            self.code,
+        )
+
+
+def _query_key(arg: typing.Any) -> typing.Hashable:
+    if isinstance(arg, ManualFixupIdentifier):
+        return arg._cache_key()
+    return arg
+
+
+def _cached_query(query: typing.Callable[..., _T]) -> typing.Callable[..., _T]:
+    """Caches the results of a :class:`Database` query. See `Database.query_cache_size`."""
+
+    @functools.wraps(query)
+    def wrapper(self: "Database", *args, **kwargs) -> _T:
+        key = (
+            query.__name__,
+            *(_query_key(x) for x in args),
+            *((k, _query_key(v)) for k, v in sorted(kwargs.items())),
+        )
+        with self._cache_lock:
+            if self._query_cache_increment != self.increment:
+                self._query_cache.clear()
+                self._query_cache_increment = self.increment
+            if key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                return self._query_cache[key]
+
+        result = query(self, *args, **kwargs)
+        if self.query_cache_size > 0:
+            with self._cache_lock:
+                self._query_cache[key] = result
+                while len(self._query_cache) > self.query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
 
 class Database:
     """A YGOJSON database.
@@ -2072,6 +2814,11 @@ class Database:
     cards_by_en_name: typing.Dict[str, Card]
     """You may use this to look up cards by their case-sensitive English name."""
 
+    cards_by_name: typing.Dict[Language, typing.Dict[str, Card]]
+    """You may use this to look up cards by their name in any language.
+    Names are normalized with `normalize_name`. See also `Database.lookup_card_by_name`.
+    """
+
     cards_by_konami_cid: typing.Dict[int, Card]
     """You may use this to look up cards by their Konami official databse ID."""
 
@@ -2093,9 +2840,17 @@ class Database:
     sets_by_en_name: typing.Dict[str, Set]
     """You may use this to look up sets by their case-sensitive English names."""
 
+    sets_by_name: typing.Dict[Language, typing.Dict[str, Set]]
+    """You may use this to look up sets by their name in any language.
+    Names are normalized with `normalize_name`. See also `Database.lookup_set_by_name`.
+    """
+
     sets_by_konami_sid: typing.Dict[int, Set]
     """You may use this to look up sets by their Konami official database ID."""
 
+    set_locales_by_konami_sid: typing.Dict[int, SetLocale]
+    """You may use this to look up the locale of a set a Konami official database ID belongs to."""
+
     sets_by_yugipedia_id: typing.Dict[int, Set]
     """You may use this to look up sets by their Yugipedia page ID."""
 
@@ -2109,7 +2864,40 @@ class Database:
     """You may use this to look up card printings by their UUID."""
 
     printings_by_code: typing.Dict[str, typing.List[CardPrinting]]
-    """You may use this to look up card printings by their full set code."""
+    """You may use this to look up card printings by their full set code.
+    For prefix and range queries over set codes, see `Database.printings_with_code_prefix`.
+    """
+
+    _sorted_codes: typing.Optional[typing.List[str]]
+    """The keys of `Database.printings_by_code`, sorted. None if it needs to be regenerated."""
+
+    _coded_printings_by_set: typing.Dict[
+        uuid.UUID, typing.List[typing.Tuple[str, CardPrinting]]
+    ]
+    """The entries each set contributed to `Database.printings_by_code`, by UUID."""
+
+    printings_by_card: typing.Dict[uuid.UUID, typing.List[PrintingLocation]]
+    """You may use this to look up every printing of a card by the card's UUID,
+    along with the set and contents of each printing.
+    See `PrintingLocation.locales` for the locales each printing was printed in.
+    """
+
+    _printing_locations_by_set: typing.Dict[uuid.UUID, typing.Set[uuid.UUID]]
+    """The cards each set contributed entries to `Database.printings_by_card` for, by UUID."""
+
+    images_by_printing_id: typing.Dict[
+        uuid.UUID, typing.Dict[typing.Tuple[Locale, SetEdition], str]
+    ]
+    """You may use this to look up every image of a printing by the printing's UUID.
+    Images are keyed by the locale and edition they are for; see `SetLocale.card_images`.
+    Printings without any images do not appear here.
+    """
+
+    _imaged_printings_by_set: typing.Dict[uuid.UUID, typing.Set[uuid.UUID]]
+    """The printings each set contributed entries to `Database.images_by_printing_id` for, by UUID."""
+
+    _set_backlinks: typing.Dict[uuid.UUID, typing.Tuple[Set, typing.Dict[Card, int]]]
+    """The set each set UUID was last added as, and the cards it added to `Card.sets`, with their printing counts."""
 
     series: typing.List[Series]
     """Series/archetypes in this database."""
@@ -2120,9 +2908,19 @@ class Database:
     series_by_en_name: typing.Dict[str, Series]
     """You may use this to look up series/archetypes by their case-sensitive English names."""
 
+    series_by_name: typing.Dict[Language, typing.Dict[str, Series]]
+    """You may use this to look up series/archetypes by their name in any language.
+    Names are normalized with `normalize_name`. See also `Database.lookup_series_by_name`.
+    """
+
     series_by_yugipedia_id: typing.Dict[int, Series]
     """You may use this to look up series/archetypes by their Yugipedia page ID."""
 
+    _series_backlinks: typing.Dict[
+        uuid.UUID, typing.Tuple[Series, typing.Dict[Card, int]]
+    ]
+    """The series each series UUID was last added as, and the cards it added to `Card.series`."""
+
     distros: typing.List[PackDistrobution]
     """Pack distributions in this database."""
 
@@ -2141,15 +2939,43 @@ class Database:
     products_by_en_name: typing.Dict[str, SealedProduct]
     """You may use this to look up pack distributions by their case-sensitive English names."""
 
+    products_by_name: typing.Dict[Language, typing.Dict[str, SealedProduct]]
+    """You may use this to look up sealed products by their name in any language.
+    Names are normalized with `normalize_name`. See also `Database.lookup_product_by_name`.
+    """
+
     products_by_yugipedia_id: typing.Dict[int, SealedProduct]
     """You may use this to look up sealed products by their Yugipedia page ID."""
 
     products_by_konami_pid: typing.Dict[int, SealedProduct]
     """You may use this to look up sealed products by their Konami official database ID."""
 
+    product_locales_by_konami_pid: typing.Dict[int, SealedProductLocale]
+    """You may use this to look up the locale of a sealed product a Konami official database ID belongs to."""
+
     products_by_pack_id: typing.Dict[uuid.UUID, SealedProduct]
     """You may use this to look up sealed products by what packs they are a booster box of."""
 
+    _derived_indexes: typing.Dict[str, typing.Any]
+    """Indexes computed from the database as a whole, built on demand.
+    Cleared whenever anything is added to the database.
+    """
+
+    query_cache_size: int
+    """How many query results to remember, such as those of `Database.lookup_card` or `Database.banlist_at`.
+    The least recently used results are forgotten first. Set to 0 to disable caching.
+    Cached results are cleared whenever anything is added to the database or `Database.increment` changes.
+    Cached results are shared between callers, so do not modify them.
+    """
+
+    _query_cache: typing.OrderedDict[typing.Hashable, typing.Any]
+    _query_cache_increment: int
+
+    _cache_lock: threading.RLock
+    """Guards `Database._query_cache` and `Database._derived_indexes`,
+    which are filled in by queries, so that many threads can query a database at once.
+    """
+
     def __init__(
         self,
         *,
@@ -2169,6 +2995,7 @@ class Database:
         self.cards_by_password = {}
         self.cards_by_yamlyugi = {}
         self.cards_by_en_name = {}
+        self.cards_by_name = {}
         self.cards_by_konami_cid = {}
         self.cards_by_yugipedia_id = {}
         self.cards_by_ygoprodeck_id = {}
@@ -2178,18 +3005,29 @@ class Database:
         self.sets = []
         self.sets_by_id = {}
         self.sets_by_en_name = {}
+        self.sets_by_name = {}
         self.sets_by_konami_sid = {}
+        self.set_locales_by_konami_sid = {}
         self.sets_by_yugipedia_id = {}
         self.sets_by_yugipedia_name = {}
         self.sets_by_ygoprodeck_id = {}
 
         self.printings_by_id = {}
         self.printings_by_code = {}
+        self._sorted_codes = None
+        self._coded_printings_by_set = {}
+        self.printings_by_card = {}
+        self._printing_locations_by_set = {}
+        self.images_by_printing_id = {}
+        self._imaged_printings_by_set = {}
+        self._set_backlinks = {}
 
         self.series = []
         self.series_by_id = {}
         self.series_by_en_name = {}
+        self.series_by_name = {}
         self.series_by_yugipedia_id = {}
+        self._series_backlinks = {}
 
         self.distros = []
         self.distros_by_id = {}
@@ -2198,13 +3036,37 @@ class Database:
         self.products = []
         self.products_by_id = {}
         self.products_by_en_name = {}
+        self.products_by_name = {}
         self.products_by_yugipedia_id = {}
         self.products_by_konami_pid = {}
+        self.product_locales_by_konami_pid = {}
         self.products_by_pack_id = {}
 
+        self._derived_indexes = {}
+
+        self.query_cache_size = 4096
+        self._query_cache = collections.OrderedDict()
+        self._query_cache_increment = self.increment
+        self._cache_lock = threading.RLock()
+
+    def _derived_index(self, name: str, build: typing.Callable[[], _T]) -> _T:
+        with self._cache_lock:
+            if name in self._derived_indexes:
+                return self._derived_indexes[name]
+        index = build()
+        with self._cache_lock:
+            return self._derived_indexes.setdefault(name, index)
+
+    def _invalidate_caches(self):
+        with self._cache_lock:
+            self._derived_indexes.clear()
+            self._query_cache.clear()
+
     def add_card(self, card: Card):
         """Adds a card to this database, or updated its lookup information if it's already in the database."""
 
+        self._invalidate_caches()
+
         if card.id not in self.cards_by_id:
             self.cards.append(card)
 
@@ -2215,6 +3077,8 @@ class Database:
             self.cards_by_yamlyugi[card.yamlyugi_id] = card
         if Language.ENGLISH in card.text:
             self.cards_by_en_name[card.text[Language.ENGLISH].name] = card
+        for lang, text in card.text.items():
+            self.cards_by_name.setdefault(lang, {})[normalize_name(text.name)] = card
         if card.db_id:
             self.cards_by_konami_cid[card.db_id] = card
         for page in card.yugipedia_pages or []:
@@ -2228,46 +3092,221 @@ class Database:
     def add_set(self, set_: Set):
         """Adds a set to this database, or updated its lookup information if it's already in the database."""
 
+        self._invalidate_caches()
+
         if set_.id not in self.sets_by_id:
             self.sets.append(set_)
 
         self.sets_by_id[set_.id] = set_
         if Language.ENGLISH in set_.name:
             self.sets_by_en_name[set_.name[Language.ENGLISH]] = set_
+        for lang, name in set_.name.items():
+            self.sets_by_name.setdefault(lang, {})[normalize_name(name)] = set_
         if set_.yugipedia:
             self.sets_by_yugipedia_id[set_.yugipedia.id] = set_
             self.sets_by_yugipedia_name[set_.yugipedia.name] = set_
         for locale in set_.locales.values():
             for db_id in locale.db_ids:
                 self.sets_by_konami_sid[db_id] = set_
+                self.set_locales_by_konami_sid[db_id] = locale
+
+        for card_id in self._printing_locations_by_set.pop(set_.id, ()):
+            self.printings_by_card[card_id] = [
+                x for x in self.printings_by_card[card_id] if x.set.id != set_.id
+            ]
+        located_cards: typing.Set[uuid.UUID] = set()
+        self._printing_locations_by_set[set_.id] = located_cards
+
+        for code, printing in self._coded_printings_by_set.pop(set_.id, ()):
+            printings = [x for x in self.printings_by_code[code] if x is not printing]
+            if printings:
+                self.printings_by_code[code] = printings
+            else:
+                del self.printings_by_code[code]
+                self._sorted_codes = None
+        coded_printings: typing.List[typing.Tuple[str, CardPrinting]] = []
+        self._coded_printings_by_set[set_.id] = coded_printings
+
+        for printing_id in self._imaged_printings_by_set.pop(set_.id, ()):
+            self.images_by_printing_id.pop(printing_id, None)
+        imaged_printings: typing.Set[uuid.UUID] = set()
+        self._imaged_printings_by_set[set_.id] = imaged_printings
+
+        for locale in set_.locales.values():
+            for edition, images in locale.card_images.items():
+                for printing, url in images.items():
+                    self.images_by_printing_id.setdefault(printing.id, {})[
+                        (locale.key, edition)
+                    ] = url
+                    imaged_printings.add(printing.id)
+
         for content in set_.contents:
             if content.ygoprodeck:
                 self.sets_by_ygoprodeck_id[content.ygoprodeck] = set_
+            removed_cards = set(content.removed_cards)
             for printing in [*content.cards, *content.removed_cards]:
                 self.printings_by_id[printing.id] = printing
+
+                locations = self.printings_by_card.setdefault(printing.card.id, [])
+                located_cards.add(printing.card.id)
+                locations.append(
+                    PrintingLocation(
+                        printing=printing,
+                        set=set_,
+                        contents=content,
+                        removed=printing in removed_cards,
+                    )
+                )
+
                 if printing.suffix:
-                    for locale_id in content.locales:
-                        if locale_id in set_.locales:
-                            prefix = set_.locales[locale_id].prefix
-                            if prefix:
-                                code = prefix + printing.suffix
-                                self.printings_by_code.setdefault(code, [])
+                    for locale in content.locales:
+                        if locale.prefix:
+                            code = locale.prefix + printing.suffix
+                            if code not in self.printings_by_code:
+                                self.printings_by_code[code] = []
+                                self._sorted_codes = None
+                            if printing not in self.printings_by_code[code]:
                                 self.printings_by_code[code].append(printing)
+                                coded_printings.append((code, printing))
+
+        self._update_set_backlinks(set_)
+
+    def _update_set_backlinks(self, set_: Set):
+        members: typing.Dict[Card, int] = {}
+        for content in set_.contents:
+            for printing in content.cards:
+                members[printing.card] = members.get(printing.card, 0) + 1
+        self._update_backlinks(
+            self._set_backlinks, set_, members, lambda card: card.sets
+        )
+
+    def _update_series_backlinks(self, series: Series):
+        self._update_backlinks(
+            self._series_backlinks,
+            series,
+            {card: 1 for card in series.members},
+            lambda card: card.series,
+        )
+
+    def _update_backlinks(
+        self,
+        snapshots: typing.Dict[uuid.UUID, typing.Tuple[_T, typing.Dict[Card, int]]],
+        container: _T,
+        members: typing.Dict[Card, int],
+        backlinks: typing.Callable[[Card], Backlinks[_T]],
+    ):
+        """Brings the backlinks from cards to a set or series up to date,
+        changing only the cards whose membership changed since it was last added.
+        """
+
+        id: uuid.UUID = getattr(container, "id")
+        old_container, old_members = snapshots.get(id, (container, {}))
+        if old_container is not container:
+            for card in old_members:
+                backlinks(card).discard(old_container)
+            old_members = {}
+
+        for card in old_members:
+            if card not in members:
+                backlinks(card).discard(container)
+        for card, n in members.items():
+            change = n - old_members.get(card, 0)
+            if change > 0:
+                backlinks(card).add(container, change)
+            elif change < 0:
+                backlinks(card).subtract(container, -change)
+        snapshots[id] = (container, members)
+
+    def _codes_between(
+        self, start: str, end: typing.Optional[str]
+    ) -> typing.Iterable[str]:
+        if self._sorted_codes is None:
+            self._sorted_codes = sorted(self.printings_by_code)
+        i = bisect.bisect_left(self._sorted_codes, start)
+        j = (
+            bisect.bisect_left(self._sorted_codes, end, i)
+            if end is not None
+            else len(self._sorted_codes)
+        )
+        return self._sorted_codes[i:j]
+
+    @_cached_query
+    def printings_with_code_prefix(
+        self, prefix: str
+    ) -> typing.Dict[str, typing.List[CardPrinting]]:
+        """Looks up all card printings whose full set code starts with the given prefix.
+        For example, ``"LOB-EN"`` finds every English printing in Legend of Blue Eyes White Dragon.
+
+        :param prefix: The start of a set code. Case-sensitive.
+        :return: A mapping of full set codes to printings, in order of set code.
+        """
+
+        result: typing.Dict[str, typing.List[CardPrinting]] = {}
+        for code in self._codes_between(prefix, None):
+            if not code.startswith(prefix):
+                break
+            result[code] = self.printings_by_code[code]
+        return result
+
+    @_cached_query
+    def printings_with_code_in_range(
+        self, start: str, end: str
+    ) -> typing.Dict[str, typing.List[CardPrinting]]:
+        """Looks up all card printings whose full set code is between ``start`` (inclusive) and ``end`` (exclusive).
+        For example, ``"LOB-EN001"`` to ``"LOB-EN051"`` finds the first fifty cards of the English Legend of Blue Eyes White Dragon.
+
+        :return: A mapping of full set codes to printings, in order of set code.
+        """
+
+        return {
+            code: self.printings_by_code[code]
+            for code in self._codes_between(start, end)
+        }
+
+    @_cached_query
+    def printings_with_code_suffix(
+        self, set_code: str, suffix: str
+    ) -> typing.Dict[str, typing.List[CardPrinting]]:
+        """Looks up printings of one card number in a set, across all regional prefixes.
+        For example, ``"LOB"`` and ``"001"`` finds ``LOB-001``, ``LOB-EN001``, ``LOB-E001``, ``LOB-DE001``, and so on.
+
+        :param set_code: The part of the set code before the dash.
+        :param suffix: The card number within the set.
+        :return: A mapping of full set codes to printings, in order of set code.
+        """
+
+        prefix = set_code + "-"
+        result: typing.Dict[str, typing.List[CardPrinting]] = {}
+        for code, printings in self.printings_with_code_prefix(prefix).items():
+            if not code.endswith(suffix):
+                continue
+            region = code[len(prefix) : len(code) - len(suffix)]
+            if not region or region.isalpha():
+                result[code] = printings
+        return result
 
     def add_series(self, series: Series):
         """Adds a series or archetype to this database, or updated its lookup information if it's already in the database."""
 
+        self._invalidate_caches()
+
         if series.id not in self.series_by_id:
             self.series.append(series)
             self.series_by_id[series.id] = series
         if Language.ENGLISH in series.name:
             self.series_by_en_name[series.name[Language.ENGLISH]] = series
+        for lang, name in series.name.items():
+            self.series_by_name.setdefault(lang, {})[normalize_name(name)] = series
         if series.yugipedia:
             self.series_by_yugipedia_id[series.yugipedia.id] = series
 
+        self._update_series_backlinks(series)
+
     def add_distro(self, distro: PackDistrobution):
         """Adds a pack distribution to this database, or updated its lookup information if it's already in the database."""
 
+        self._invalidate_caches()
+
         if distro.id not in self.distros_by_id:
             self.distros.append(distro)
             self.distros_by_id[distro.id] = distro
@@ -2277,43 +3316,51 @@ class Database:
     def add_product(self, product: SealedProduct):
         """Adds a sealed product to this database, or updated its lookup information if it's already in the database."""
 
+        self._invalidate_caches()
+
         if product.id not in self.products_by_id:
             self.products.append(product)
 
         self.products_by_id[product.id] = product
         if Language.ENGLISH in product.name:
             self.products_by_en_name[product.name[Language.ENGLISH]] = product
+        for lang, name in product.name.items():
+            self.products_by_name.setdefault(lang, {})[normalize_name(name)] = product
         if product.yugipedia:
             self.products_by_yugipedia_id[product.yugipedia.id] = product
         for locale in product.locales.values():
             for db_id in locale.db_ids:
                 self.products_by_konami_pid[db_id] = product
+                self.product_locales_by_konami_pid[db_id] = locale
         for pack in product.box_of:
             self.products_by_pack_id[pack.id] = product
 
     def regenerate_backlinks(self):
         """This does the following fixups:
-        * sets `Card.sets` based on what printings are in what sets
+        * sets `Card.sets` based on what printings are in what sets, counting printings per set
         * sets `Card.series` based on what series or archetypes list it as a member
+
+        `Database.add_set` and `Database.add_series` keep these up to date as they go,
+        so this is only needed if sets or series were changed without being added again afterwards.
         """
 
         for card in self.cards:
             card.sets.clear()
             card.series.clear()
+        self._set_backlinks.clear()
+        self._series_backlinks.clear()
         for set_ in tqdm.tqdm(
             self.sets, total=len(self.sets), desc="Regenerating card backlinks to sets"
         ):
-            for contents in set_.contents:
-                for printing in contents.cards:
-                    printing.card.sets.append(set_)
+            self._update_set_backlinks(set_)
         for series in tqdm.tqdm(
             self.series,
             total=len(self.series),
             desc="Regenerating card backlinks to series",
         ):
-            for member in series.members:
-                member.series.append(series)
+            self._update_series_backlinks(series)
 
+    @_cached_query
     def lookup_set(self, mfi: ManualFixupIdentifier) -> typing.Optional[Set]:
         """Looks up a set from an MFI."""
 
@@ -2332,6 +3379,7 @@ class Database:
             result = self.sets_by_en_name.get(mfi.name, result)
         return result
 
+    @_cached_query
     def lookup_distro(
         self, mfi: ManualFixupIdentifier
     ) -> typing.Optional[PackDistrobution]:
@@ -2344,6 +3392,7 @@ class Database:
             result = self.distros_by_name.get(mfi.name, result)
         return result
 
+    @_cached_query
     def lookup_printing(
         self, mfi: ManualFixupIdentifier
     ) -> typing.Optional[CardPrinting]:
@@ -2415,6 +3464,7 @@ class Database:
             raise Exception(f"Ambiguous printing MFI: {json.dumps(mfi.to_json())}")
         return next(iter(results))
 
+    @_cached_query
     def lookup_card(self, mfi: ManualFixupIdentifier) -> typing.Optional[Card]:
         """Looks up a card from an MFI."""
 
@@ -2433,6 +3483,507 @@ class Database:
             result = self.cards_by_en_name.get(mfi.name, result)
         return result
 
+    def _lookup_by_name(
+        self,
+        index: typing.Dict[Language, typing.Dict[str, _T]],
+        name: str,
+        language: typing.Optional[Language],
+    ) -> typing.Optional[_T]:
+        if language:
+            return index.get(language, {}).get(name)
+        result = index.get(Language.ENGLISH, {}).get(name)
+        if result is None:
+            for names in index.values():
+                if name in names:
+                    return names[name]
+        return result
+
+    def lookup_card_by_name(
+        self, name: str, language: typing.Optional[Language] = None
+    ) -> typing.Optional[Card]:
+        """Looks up a card by its name, ignoring case, width, and diacritics.
+        See `normalize_name`.
+
+        :param language: The language of the name. If not given, English is tried first, then all other languages.
+        """
+        return self._lookup_by_name(self.cards_by_name, normalize_name(name), language)
+
+    def lookup_set_by_name(
+        self, name: str, language: typing.Optional[Language] = None
+    ) -> typing.Optional[Set]:
+        """Looks up a set by its name, ignoring case, width, and diacritics.
+        See `Database.lookup_card_by_name`.
+        """
+        return self._lookup_by_name(self.sets_by_name, normalize_name(name), language)
+
+    def lookup_series_by_name(
+        self, name: str, language: typing.Optional[Language] = None
+    ) -> typing.Optional[Series]:
+        """Looks up a series or archetype by its name, ignoring case, width, and diacritics.
+        See `Database.lookup_card_by_name`.
+        """
+        return self._lookup_by_name(self.series_by_name, normalize_name(name), language)
+
+    def lookup_product_by_name(
+        self, name: str, language: typing.Optional[Language] = None
+    ) -> typing.Optional[SealedProduct]:
+        """Looks up a sealed product by its name, ignoring case, width, and diacritics.
+        See `Database.lookup_card_by_name`.
+        """
+        return self._lookup_by_name(
+            self.products_by_name, normalize_name(name), language
+        )
+
+    def resolve_identifiers(
+        self, identifiers: typing.Iterable[typing.Union[str, int]]
+    ) -> typing.Dict[typing.Union[str, int], ResolvedIdentifier]:
+        """Looks up many card identifiers of mixed kinds at once, such as the contents of a deck list.
+
+        Numeric identifiers are tried as a password, then a YGOPRODECK ID, then a Konami ID.
+        Other identifiers are tried as a set code (such as "LOB-EN001"), then as a card name in any language.
+        Each distinct identifier is only normalized and looked up once, no matter how many times it appears.
+
+        :return: A mapping of each identifier given to what it refers to.
+        """
+
+        result: typing.Dict[typing.Union[str, int], ResolvedIdentifier] = {}
+        for identifier in identifiers:
+            if identifier in result:
+                continue
+
+            key = str(identifier).strip()
+            card: typing.Optional[Card] = None
+            printings: typing.List[CardPrinting] = []
+            if key.isascii() and key.isdigit():
+                card = (
+                    self.cards_by_password.get(key.zfill(8))
+                    or self.cards_by_ygoprodeck_id.get(int(key))
+                    or self.cards_by_konami_cid.get(int(key))
+                )
+            else:
+                printings = self.printings_by_code.get(key.upper(), [])
+                if printings:
+                    card = printings[0].card
+                else:
+                    card = self.lookup_card_by_name(key)
+
+            result[identifier] = ResolvedIdentifier(card, printings)
+        return result
+
+    def _legality_period_at(
+        self, card: Card, format: Format, ordinal: int
+    ) -> typing.Union[None, LegalityPeriod, CardLegality]:
+        legality = card.legality.get(format)
+        if legality is None:
+            return None
+        if not legality.history:
+            return legality
+        i = legality.history.index_at(ordinal)
+        if i is not None:
+            return legality.history[i]
+        if legality.points is not None:
+            return _POINTS_BEFORE_HISTORY
+        return _LEGALITY_BEFORE_HISTORY
+
+    def legality_at(
+        self, card: Card, format: Format, date: datetime.date
+    ) -> typing.Optional[Legality]:
+        """Looks up the legality of a card in a format as of a certain date.
+
+        If the card has no legality history in this format, its current legality is used for every date.
+        Before the first period of its history, a card is `Legality.UNLIMITED`,
+        as histories only start when a card is first put on a banlist.
+        Cards declared illegal in all formats are always `Legality.FORBIDDEN`.
+
+        :return: The legality, or None if the card has no legality at all in this format.
+        """
+
+        if card.illegal:
+            return Legality.FORBIDDEN
+        period = self._legality_period_at(card, format, date.toordinal())
+        return period.legality if period else None
+
+    def points_at(
+        self, card: Card, format: Format, date: datetime.date
+    ) -> typing.Optional[float]:
+        """Looks up how many points a card was worth in a format as of a certain date, for formats that use points.
+
+        If the card has no legality history in this format, its current point value is used for every date.
+        Before the first period of its history, a card is worth 0 points if it has a point value in this format.
+
+        :return: The point value, or None if the card has no legality at all in this format,
+            or no point value on this date.
+        """
+
+        period = self._legality_period_at(card, format, date.toordinal())
+        return period.points if period else None
+
+    def legalities_at(
+        self, cards: typing.Iterable[Card], format: Format, date: datetime.date
+    ) -> typing.Dict[Card, typing.Optional[Legality]]:
+        """Looks up the legality of many cards at once. See `Database.legality_at`."""
+
+        ordinal = date.toordinal()
+        result: typing.Dict[Card, typing.Optional[Legality]] = {}
+        for card in cards:
+            if card.illegal:
+                result[card] = Legality.FORBIDDEN
+                continue
+            period = self._legality_period_at(card, format, ordinal)
+            result[card] = period.legality if period else None
+        return result
+
+    @_cached_query
+    def banlist_at(
+        self, format: Format, date: datetime.date
+    ) -> typing.Dict[Card, Legality]:
+        """Produces the full banlist of a format as of a certain date:
+        every card in the format that was forbidden or limited in some way.
+        Cards declared illegal in all formats are not included.
+        """
+
+        unrestricted = {Legality.UNLIMITED, Legality.UNRELEASED, Legality.UNKNOWN}
+        ordinal = date.toordinal()
+        result: typing.Dict[Card, Legality] = {}
+        for card in self.cards:
+            period = self._legality_period_at(card, format, ordinal)
+            if period and period.legality not in unrestricted:
+                result[card] = period.legality
+        return result
+
+    def _release_formats(
+        self, set_: Set, locale: typing.Optional[SetLocale]
+    ) -> typing.Set[Format]:
+        formats: typing.Set[Format] = set(locale.formats) if locale else set()
+        if not formats:
+            for contents in set_.contents:
+                if locale is None or locale in contents.locales:
+                    formats.update(contents.formats)
+        if not formats and locale:
+            formats.update(locale.key.formats)
+        for format in [*formats]:
+            formats.update(format.ancestors)
+        return formats
+
+    def _release_index(
+        self,
+        releases: typing.Iterable[
+            typing.Tuple[typing.Any, typing.Iterable[typing.Any]]
+        ],
+    ) -> typing.Dict[
+        typing.Any, typing.Tuple[typing.List[int], typing.List[typing.Any]]
+    ]:
+        by_key: typing.Dict[typing.Any, typing.List[typing.Any]] = {}
+        for release, keys in releases:
+            for key in keys:
+                by_key.setdefault(key, []).append(release)
+        result = {}
+        for key, keyed_releases in by_key.items():
+            keyed_releases.sort(key=lambda x: x.date)
+            result[key] = ([x.date.toordinal() for x in keyed_releases], keyed_releases)
+        return result
+
+    def _build_set_release_index(self):
+        def releases():
+            for set_ in self.sets:
+                if set_.date:
+                    yield SetRelease(set_.date, set_, None), [
+                        None,
+                        *self._release_formats(set_, None),
+                    ]
+                for locale in set_.locales.values():
+                    if not locale.date:
+                        continue
+                    yield SetRelease(locale.date, set_, locale), [
+                        None,
+                        locale.key,
+                        *locale.key.ancestors,
+                        *self._release_formats(set_, locale),
+                    ]
+
+        return self._release_index(releases())
+
+    def _build_product_release_index(self):
+        def releases():
+            for product in self.products:
+                if product.date:
+                    yield ProductRelease(product.date, product, None), [None]
+                for locale in product.locales.values():
+                    if not locale.date:
+                        continue
+                    yield ProductRelease(locale.date, product, locale), [
+                        None,
+                        locale.key,
+                        *locale.key.ancestors,
+                        *locale.key.formats,
+                    ]
+
+        return self._release_index(releases())
+
+    def _released_between(
+        self,
+        index: typing.Dict[
+            typing.Any, typing.Tuple[typing.List[int], typing.List[typing.Any]]
+        ],
+        start: datetime.date,
+        end: datetime.date,
+        key: typing.Any,
+    ) -> typing.List[typing.Any]:
+        if key not in index:
+            return []
+        ordinals, releases = index[key]
+        i = bisect.bisect_left(ordinals, start.toordinal())
+        j = bisect.bisect_right(ordinals, end.toordinal(), i)
+        return releases[i:j]
+
+    @_cached_query
+    def sets_released_between(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+        *,
+        locale: typing.Optional[Locale] = None,
+        format: typing.Optional[Format] = None,
+    ) -> typing.List[SetRelease]:
+        """Finds every release of a set between two dates, inclusive, ordered by date.
+        Sets released in multiple locales appear once per locale.
+
+        :param locale: If given, only find releases in this locale or its sublocales.
+        :param format: If given, only find releases into this format or its subformats.
+        """
+
+        index = self._derived_index("set_releases", self._build_set_release_index)
+        if locale is not None:
+            releases = self._released_between(index, start, end, locale)
+            if format is not None:
+                releases = [
+                    x
+                    for x in releases
+                    if format in self._release_formats(x.set, x.locale)
+                ]
+            return releases
+        return self._released_between(index, start, end, format)
+
+    @_cached_query
+    def products_released_between(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+        *,
+        locale: typing.Optional[Locale] = None,
+        format: typing.Optional[Format] = None,
+    ) -> typing.List[ProductRelease]:
+        """Finds every release of a sealed product between two dates, inclusive, ordered by date.
+        Products released in multiple locales appear once per locale.
+
+        :param locale: If given, only find releases in this locale or its sublocales.
+        :param format: If given, only find releases in locales that print into this format.
+        """
+
+        index = self._derived_index(
+            "product_releases", self._build_product_release_index
+        )
+        if locale is not None:
+            releases = self._released_between(index, start, end, locale)
+            if format is not None:
+                releases = [
+                    x for x in releases if x.locale and format in x.locale.key.formats
+                ]
+            return releases
+        return self._released_between(index, start, end, format)
+
+    def _build_first_printing_dates(
+        self,
+    ) -> typing.Dict[typing.Optional[Format], typing.Dict[uuid.UUID, datetime.date]]:
+        result: typing.Dict[
+            typing.Optional[Format], typing.Dict[uuid.UUID, datetime.date]
+        ] = {}
+        for card_id, locations in self.printings_by_card.items():
+            for location in locations:
+                if location.removed:
+                    continue
+                for locale in location.locales or [None]:
+                    date = locale.date if locale else location.set.date
+                    if not date:
+                        continue
+                    for format in [
+                        None,
+                        *self._release_formats(location.set, locale),
+                    ]:
+                        dates = result.setdefault(format, {})
+                        if card_id not in dates or date < dates[card_id]:
+                            dates[card_id] = date
+        return result
+
+    def first_printing_date(
+        self, card: Card, format: typing.Optional[Format] = None
+    ) -> typing.Optional[datetime.date]:
+        """Finds the earliest date a card was printed.
+
+        :param format: If given, only consider printings released into this format or its subformats.
+        :return: The date, or None if no printing of this card has a known release date.
+        """
+
+        dates = self._derived_index(
+            "first_printing_dates", self._build_first_printing_dates
+        )
+        return dates.get(format, {}).get(card.id)
+
+    def _build_sets_by_format(self) -> typing.Dict[Format, typing.List[Set]]:
+        result: typing.Dict[Format, typing.List[Set]] = {}
+        for set_ in self.sets:
+            formats = self._release_formats(set_, None)
+            for locale in set_.locales.values():
+                formats.update(self._release_formats(set_, locale))
+            for format in formats:
+                result.setdefault(format, []).append(set_)
+        return result
+
+    def sets_in_format(self, format: Format) -> typing.List[Set]:
+        """Finds all sets released into a format or any of its subformats."""
+
+        index = self._derived_index("sets_by_format", self._build_sets_by_format)
+        return index.get(format, [])
+
+    def _build_cards_by_locale(self) -> typing.Dict[Locale, typing.List[Card]]:
+        found: typing.Dict[Locale, typing.Set[uuid.UUID]] = {}
+        for card_id, locations in self.printings_by_card.items():
+            for location in locations:
+                if location.removed:
+                    continue
+                for set_locale in location.locales:
+                    for locale in (set_locale.key, *set_locale.key.ancestors):
+                        found.setdefault(locale, set()).add(card_id)
+        return {
+            locale: [x for x in self.cards if x.id in card_ids]
+            for locale, card_ids in found.items()
+        }
+
+    def cards_in_locale(self, locale: Locale) -> typing.List[Card]:
+        """Finds all cards printed in a locale or any of its sublocales."""
+
+        index = self._derived_index("cards_by_locale", self._build_cards_by_locale)
+        return index.get(locale, [])
+
+    def _build_legal_cards_by_format(self) -> typing.Dict[Format, typing.List[Card]]:
+        playable = {
+            Legality.UNLIMITED,
+            Legality.SEMILIMITED,
+            Legality.LIMITED,
+            Legality.LIMIT1,
+            Legality.LIMIT2,
+            Legality.LIMIT3,
+        }
+        result: typing.Dict[Format, typing.List[Card]] = {}
+        for card in self.cards:
+            if card.illegal:
+                continue
+            for format, legality in card.legality.items():
+                if legality.legality in playable:
+                    result.setdefault(format, []).append(card)
+        return result
+
+    def cards_legal_in(self, format: Format) -> typing.List[Card]:
+        """Finds all cards that are currently allowed in decks of a format, at one or more copies."""
+
+        index = self._derived_index(
+            "legal_cards_by_format", self._build_legal_cards_by_format
+        )
+        return index.get(format, [])
+
+    def _contents_in(
+        self, contents: typing.List[typing.Any], locale: typing.Optional[Locale]
+    ) -> typing.List[typing.Any]:
+        if locale is None:
+            return contents
+        for locales in [(locale,), (*locale.ancestors, *locale.descendants)]:
+            found = [x for x in contents if any(y.key in locales for y in x.locales)]
+            if found:
+                return found
+        return [x for x in contents if not x.locales]
+
+    def _add_set_printings(
+        self,
+        result: typing.Dict[CardPrinting, int],
+        set_: Set,
+        locale: typing.Optional[Locale],
+        qty: int,
+        whole: bool,
+        expanding: typing.FrozenSet[uuid.UUID],
+    ):
+        if set_.id in expanding:
+            return
+        expanding = expanding | {set_.id}
+
+        for contents in self._contents_in(set_.contents, locale):
+            guaranteed = whole or contents.distrobution == SpecialDistroType.PRECON
+            for printing in contents.cards:
+                result[printing] = result.get(printing, 0) + (
+                    printing.qty * qty if guaranteed else 0
+                )
+
+            if whole or not isinstance(contents.distrobution, uuid.UUID):
+                continue
+            distro = self.distros_by_id.get(contents.distrobution)
+            for slot in distro.slots if distro else []:
+                if isinstance(slot, PackDistroSlotCards):
+                    for printing in slot.cards:
+                        result[printing] = result.get(printing, 0) + qty
+                elif isinstance(slot, PackDistroSlotSet):
+                    self._add_set_printings(
+                        result, slot.set, locale, qty, True, expanding
+                    )
+                elif isinstance(slot, PackDistroSlotPool) and slot.set:
+                    self._add_set_printings(
+                        result, slot.set, locale, 0, False, expanding
+                    )
+
+    def _build_product_printings(
+        self, product: SealedProduct, locale: typing.Optional[Locale]
+    ) -> typing.Dict[CardPrinting, int]:
+        result: typing.Dict[CardPrinting, int] = {}
+        for contents in self._contents_in(product.contents, locale):
+            for pack, qty in contents.packs.items():
+                if not pack.card:
+                    self._add_set_printings(
+                        result, pack.set, locale, qty, False, frozenset()
+                    )
+                    continue
+
+                printings = [
+                    printing
+                    for set_contents in self._contents_in(pack.set.contents, locale)
+                    for printing in set_contents.cards
+                    if printing.card == pack.card
+                ]
+                for printing in printings:
+                    result[printing] = result.get(printing, 0) + (
+                        qty if len(printings) == 1 else 0
+                    )
+        return result
+
+    def product_printings(
+        self, product: SealedProduct, locale: typing.Optional[Locale] = None
+    ) -> typing.Dict[CardPrinting, int]:
+        """Expands a sealed product into every card printing that can be obtained from it.
+
+        Packs of sets with a pack distribution count the printings guaranteed by that distribution,
+        and preconstructed sets count every printing, at its `CardPrinting.qty`.
+        Printings that can only be pulled at random are included with a quantity of 0.
+
+        :param locale: If given, only consider the contents of the product and its sets in this locale.
+        :return: A mapping of printings to how many of them are guaranteed to be in the product.
+        """
+
+        memo: typing.Dict[
+            typing.Tuple[uuid.UUID, typing.Optional[Locale]],
+            typing.Dict[CardPrinting, int],
+        ] = self._derived_index("product_printings", dict)
+        key = (product.id, locale)
+        if key not in memo:
+            memo[key] = self._build_product_printings(product, locale)
+        return memo[key]
+
     def manually_fixup_sets(self):
         """Applies all set manual fixups to this database."""
 
@@ -3339,6 +4890,8 @@ class Database:
                 return self._deduplicate(list_, dict_)
 
     def deduplicate(self):
+        self._invalidate_caches()
+
         with tqdm.tqdm(total=5, desc="Deduplicating database") as progress_bar:
             self._deduplicate(self.cards, self.cards_by_id)
             progress_bar.update(1)
@@ -3351,16 +4904,151 @@ class Database:
             self._deduplicate(self.products, self.products_by_id)
             progress_bar.update(1)
 
+    def intern_strings(self) -> int:
+        """Makes equal strings found throughout this database share a single string object, to save memory.
+        This covers strings that tend to be repeated many times, such as names, set code prefixes and suffixes,
+        language codes, image URLs, and skill characters and types.
+
+        :return: Roughly how many bytes of duplicate strings are no longer referenced by the database.
+            Each duplicate string object is counted once, however many places referred to it.
+        """
+
+        pool: typing.Dict[str, str] = {}
+        replaced: typing.Dict[int, str] = {}  # kept alive so their IDs stay unique
+
+        def intern(s: typing.Optional[str]) -> typing.Optional[str]:
+            if s is None:
+                return None
+            result = pool.setdefault(s, s)
+            if result is not s:
+                replaced[id(s)] = s
+            return result
+
+        def intern_pair(pair: typing.Optional[ExternalIdPair]):
+            if pair:
+                pair.name = intern(pair.name)
+
+        def intern_names(names: typing.Dict[Language, str]):
+            for lang, name in names.items():
+                names[lang] = intern(name)
+
+        for card in self.cards:
+            for text in card.text.values():
+                text.name = intern(text.name)
+            card.character = intern(card.character)
+            card.skill_type = intern(card.skill_type)
+            for image in card.images:
+                image.crop_art = intern(image.crop_art)
+                image.card_art = intern(image.card_art)
+            for page in card.yugipedia_pages or []:
+                intern_pair(page)
+            intern_pair(card.ygoprodeck)
+
+        for set_ in self.sets:
+            intern_names(set_.name)
+            intern_pair(set_.yugipedia)
+            for locale in set_.locales.values():
+                locale.language = intern(locale.language)
+                locale.prefix = intern(locale.prefix)
+                locale.image = intern(locale.image)
+                locale.box_image = intern(locale.box_image)
+                for images in locale.card_images.values():
+                    for printing, url in images.items():
+                        images[printing] = intern(url)
+            for contents in set_.contents:
+                contents.image = intern(contents.image)
+                contents.box_image = intern(contents.box_image)
+                contents.ygoprodeck = intern(contents.ygoprodeck)
+                for printing in [*contents.cards, *contents.removed_cards]:
+                    printing.suffix = intern(printing.suffix)
+
+        for series in self.series:
+            intern_names(series.name)
+            intern_pair(series.yugipedia)
+
+        for product in self.products:
+            intern_names(product.name)
+            intern_pair(product.yugipedia)
+            for product_locale in product.locales.values():
+                product_locale.image = intern(product_locale.image)
+            for product_contents in product.contents:
+                product_contents.image = intern(product_contents.image)
+
+        return sum(sys.getsizeof(x) for x in replaced.values())
+
+    def copy(self) -> "Database":
+        """Makes a copy of this database that shares no objects with this one.
+        Changes made to the copy do not affect this database, and vice versa.
+        Everything is copied by saving it to JSON and loading it back,
+        so the JSON written by ``_to_json`` methods must not share lists or dicts with the objects themselves.
+        """
+
+        result = Database(
+            individuals_dir=self.individuals_dir, aggregates_dir=self.aggregates_dir
+        )
+        result._load_meta_json(self._save_meta_json())
+        result.query_cache_size = self.query_cache_size
+        for card in self.cards:
+            result.add_card(result._load_card(card._to_json()))
+        for set_ in self.sets:
+            result.add_set(result._load_set(set_._to_json()))
+        for series in self.series:
+            result.add_series(result._load_series(series._to_json()))
+        for distro in self.distros:
+            result.add_distro(result._load_distro(distro._to_json()))
+        for product in self.products:
+            result.add_product(result._load_product(product._to_json()))
+        return result
+
+
+class VersionedDatabase:
+    """Lets many threads read from a :class:`Database` while another thread updates it.
+
+    Readers should take `VersionedDatabase.current` once and use that database for the rest of their work.
+    Updates are made to a private copy of the database, which replaces `VersionedDatabase.current`
+    all at once when the update finishes, so readers never see a half-finished update.
+    Readers never wait on updates, only briefly on each other when filling in query caches;
+    only one update can happen at a time.
+    """
+
+    current: Database
+    """The latest published version of the database. Do not modify it; use `VersionedDatabase.update` instead."""
+
+    _update_lock: threading.Lock
+
+    def __init__(self, db: Database) -> None:
+        self.current = db
+        self._update_lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def update(self) -> typing.Iterator[Database]:
+        """Starts an update to the database. Use this as a context manager::
+
+            with versioned.update() as db:
+                import_from_ygoprodeck(db)
+                import_from_yaml_yugi(db)
+
+        The changes are published when the ``with`` block exits normally,
+        and discarded if it raises an exception.
+        """
+
+        with self._update_lock:
+            draft = self.current.copy()
+            yield draft
+            self.current = draft
+
 
 def load_from_file(
     *,
     individuals_dir: typing.Optional[str] = None,
     aggregates_dir: typing.Optional[str] = None,
+    intern_strings: bool = True,
 ) -> Database:
     """Load a :class:`ygojson.database.Database` from file.
 
     :param individuals_dir: A directory containing individuals, defaults to None
     :param aggregates_dir: A directory containing aggregates, defaults to None
+    :param intern_strings: Whether to run `Database.intern_strings` after loading, defaults to True
     """
 
     if aggregates_dir is None and individuals_dir is None:
@@ -3485,6 +5173,9 @@ def load_from_file(
                 product = result._load_product(json.load(outfile))
             result.add_product(product)
 
+    if intern_strings:
+        result.intern_strings()
+
     return result
 
 
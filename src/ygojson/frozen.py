@@ -0,0 +1,285 @@
+# A frozen, flat, read-only form of a database, suitable for sharing between processes with mmap.
+
+import array
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import typing
+import uuid
+
+from .database import *
+
+FROZEN_MAGIC = b"YGOJSONF"
+"""The first bytes of every frozen database file."""
+
+FROZEN_VERSION = 1
+"""The version of the frozen database file format we are currently at."""
+
+_HEADER = struct.Struct("<8sIB3xI")  # magic, version, big-endian flag, section count
+_SECTION = struct.Struct("<32sQQ")  # name, offset, length
+_ALIGNMENT = 8
+
+RECORD_KINDS = ["cards", "sets", "series", "distros", "products"]
+"""The kinds of records in a frozen database, named after the lists in :class:`Database` they come from."""
+
+
+def _key_tables(db: Database) -> typing.Dict[str, typing.Dict[str, int]]:
+    card_indices = {x.id: i for i, x in enumerate(db.cards)}
+    set_indices_by_printing = {
+        printing.id: i
+        for i, set_ in enumerate(db.sets)
+        for contents in set_.contents
+        for printing in [*contents.cards, *contents.removed_cards]
+    }
+
+    cards_by_password: typing.Dict[str, int] = {}
+    for password, card in db.cards_by_password.items():
+        cards_by_password[password] = card_indices[card.id]
+
+    cards_by_name: typing.Dict[str, int] = {}
+    for language in [Language.ENGLISH, *db.cards_by_name]:
+        for name, card in db.cards_by_name.get(language, {}).items():
+            cards_by_name.setdefault(name, card_indices[card.id])
+
+    sets_by_code: typing.Dict[str, int] = {}
+    for code, printings in db.printings_by_code.items():
+        sets_by_code[code] = set_indices_by_printing[printings[0].id]
+
+    return {
+        "cards_by_id": {str(x.id): i for i, x in enumerate(db.cards)},
+        "cards_by_password": cards_by_password,
+        "cards_by_name": cards_by_name,
+        "sets_by_id": {str(x.id): i for i, x in enumerate(db.sets)},
+        "sets_by_code": sets_by_code,
+        "series_by_id": {str(x.id): i for i, x in enumerate(db.series)},
+        "distros_by_id": {str(x.id): i for i, x in enumerate(db.distros)},
+        "products_by_id": {str(x.id): i for i, x in enumerate(db.products)},
+    }
+
+
+def freeze(db: Database, path: str):
+    """Writes a database to a file that can be opened with :class:`FrozenDatabase`.
+
+    Each card, set, series, pack distribution, and sealed product is stored as its JSON,
+    the same JSON found in the individual files written by `Database.save`.
+    """
+
+    sections: typing.List[typing.Tuple[str, bytes]] = []
+
+    for kind in RECORD_KINDS:
+        blob = bytearray()
+        offsets = array.array("Q", [0])
+        for thing in getattr(db, kind):
+            blob += json.dumps(thing._to_json(), ensure_ascii=False).encode("utf-8")
+            offsets.append(len(blob))
+        sections.append((f"records.{kind}", bytes(blob)))
+        sections.append((f"offsets.{kind}", offsets.tobytes()))
+
+    for name, table in _key_tables(db).items():
+        keys = sorted((k.encode("utf-8"), v) for k, v in table.items())
+        blob = bytearray()
+        offsets = array.array("Q", [0])
+        values = array.array("I")
+        for key, value in keys:
+            blob += key
+            offsets.append(len(blob))
+            values.append(value)
+        sections.append((f"keys.{name}", bytes(blob)))
+        sections.append((f"keyoffsets.{name}", offsets.tobytes()))
+        sections.append((f"values.{name}", values.tobytes()))
+
+    position = _HEADER.size + _SECTION.size * len(sections)
+    directory: typing.List[typing.Tuple[str, int, int]] = []
+    for name, data in sections:
+        position += -position % _ALIGNMENT
+        directory.append((name, position, len(data)))
+        position += len(data)
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(
+            _HEADER.pack(
+                FROZEN_MAGIC, FROZEN_VERSION, sys.byteorder == "big", len(sections)
+            )
+        )
+        for name, offset, length in directory:
+            file.write(_SECTION.pack(name.encode("ascii"), offset, length))
+        for (name, data), (_, offset, _) in zip(sections, directory):
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(data)
+    os.replace(temp_path, path)
+
+
+class _SortedKeys:
+    """A read-only sequence view of the sorted keys of a key table, for bisection."""
+
+    def __init__(self, blob: memoryview, offsets: memoryview) -> None:
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return bytes(self.blob[self.offsets[i] : self.offsets[i + 1]])
+
+
+class FrozenDatabase:
+    """A read-only database backed by a file written by `freeze`.
+
+    The file is memory-mapped, so any number of processes can open the same file
+    and share one copy of it in memory. Records are only decoded when asked for,
+    and are returned as JSON, in the same format as the individual files written by `Database.save`.
+    """
+
+    path: str
+    """The path to the frozen database file."""
+
+    _file: typing.BinaryIO
+    _mmap: mmap.mmap
+    _view: memoryview
+    _sections: typing.Dict[str, memoryview]
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._sections = {}
+        self._file = open(path, "rb")
+
+        # check the header before mapping anything, so a bad file only needs closing
+        try:
+            header = self._file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"Not a frozen YGOJSON database: {path}")
+            magic, version, big_endian, n_sections = _HEADER.unpack(header)
+            if magic != FROZEN_MAGIC:
+                raise ValueError(f"Not a frozen YGOJSON database: {path}")
+            if version != FROZEN_VERSION:
+                raise ValueError(
+                    f"Unsupported frozen YGOJSON database version {version}: {path}"
+                )
+            if bool(big_endian) != (sys.byteorder == "big"):
+                raise ValueError(
+                    f"Frozen YGOJSON database has wrong byte order: {path}"
+                )
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mmap)
+
+        try:
+            for i in range(n_sections):
+                name, offset, length = _SECTION.unpack_from(
+                    self._view, _HEADER.size + _SECTION.size * i
+                )
+                section = self._view[offset : offset + length]
+                name = name.rstrip(b"\0").decode("ascii")
+                if name.startswith("offsets.") or name.startswith("keyoffsets."):
+                    section = section.cast("Q")
+                elif name.startswith("values."):
+                    section = section.cast("I")
+                self._sections[name] = section
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Unmaps the file. Records already returned remain usable."""
+
+        for section in self._sections.values():
+            section.release()
+        self._sections.clear()
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "FrozenDatabase":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def count(self, kind: str) -> int:
+        """Returns how many records of a kind there are. See `RECORD_KINDS`."""
+        return len(self._sections[f"offsets.{kind}"]) - 1
+
+    def record(self, kind: str, i: int) -> typing.Dict[str, typing.Any]:
+        """Decodes a single record by index. See `RECORD_KINDS`."""
+
+        offsets = self._sections[f"offsets.{kind}"]
+        return json.loads(
+            bytes(self._sections[f"records.{kind}"][offsets[i] : offsets[i + 1]])
+        )
+
+    def records(self, kind: str) -> typing.Iterable[typing.Dict[str, typing.Any]]:
+        """Decodes every record of a kind, one at a time. See `RECORD_KINDS`."""
+
+        for i in range(self.count(kind)):
+            yield self.record(kind, i)
+
+    def _lookup(self, table: str, key: str) -> typing.Optional[int]:
+        keys = _SortedKeys(
+            self._sections[f"keys.{table}"], self._sections[f"keyoffsets.{table}"]
+        )
+        encoded = key.encode("utf-8")
+        i = bisect.bisect_left(keys, encoded)
+        if i < len(keys) and keys[i] == encoded:
+            return self._sections[f"values.{table}"][i]
+        return None
+
+    def _lookup_record(
+        self, table: str, kind: str, key: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        i = self._lookup(table, key)
+        return None if i is None else self.record(kind, i)
+
+    def lookup_card(
+        self, id: uuid.UUID
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up a card by UUID."""
+        return self._lookup_record("cards_by_id", "cards", str(id))
+
+    def lookup_card_by_password(
+        self, password: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up a card by password."""
+        return self._lookup_record("cards_by_password", "cards", password)
+
+    def lookup_card_by_name(
+        self, name: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up a card by its name in any language. See `normalize_name`."""
+        return self._lookup_record("cards_by_name", "cards", normalize_name(name))
+
+    def lookup_set(
+        self, id: uuid.UUID
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up a set by UUID."""
+        return self._lookup_record("sets_by_id", "sets", str(id))
+
+    def lookup_set_by_code(
+        self, code: str
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up the set a printing was printed in by its full set code, such as "LOB-EN001"."""
+        return self._lookup_record("sets_by_code", "sets", code)
+
+    def lookup_series(
+        self, id: uuid.UUID
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up a series or archetype by UUID."""
+        return self._lookup_record("series_by_id", "series", str(id))
+
+    def lookup_distro(
+        self, id: uuid.UUID
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up a pack distribution by UUID."""
+        return self._lookup_record("distros_by_id", "distros", str(id))
+
+    def lookup_product(
+        self, id: uuid.UUID
+    ) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Looks up a sealed product by UUID."""
+        return self._lookup_record("products_by_id", "products", str(id))
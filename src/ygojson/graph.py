@@ -0,0 +1,218 @@
+# A compact, integer-indexed view of how cards, sets, series, and products relate to each other.
+
+import array
+import enum
+import typing
+import uuid
+
+from .database import *
+
+GraphNode = typing.Union[Card, Set, Series, PackDistrobution, SealedProduct]
+
+
+class GraphNodeKind(enum.Enum):
+    """The kind of thing a node in a :class:`Graph` represents."""
+
+    CARD = "card"
+    SET = "set"
+    SERIES = "series"
+    DISTRO = "distro"
+    PRODUCT = "product"
+
+
+class Graph:
+    """The containment relationships between the things in a :class:`Database`, as integer adjacency arrays.
+
+    Every card, set, series, pack distribution, and sealed product is given a node index.
+    Nodes are numbered by kind: all cards first, then sets, series, distributions, and products.
+    Edges point from a container to the things it contains:
+
+    * sets contain the cards printed in them, and the pack distributions they use
+    * series contain their member cards
+    * pack distributions contain the cards and sets their guaranteed slots give out,
+      and the sets their pool slots pull cards from instead of the pack's own set
+    * sealed products contain the sets of their packs and booster boxes, and their predetermined cards
+
+    Edges are stored in compressed sparse row form, both forwards (`Graph.contents`)
+    and backwards (`Graph.containers`). Build one with `build_graph`.
+    A graph is a snapshot: it does not change when the database does.
+    """
+
+    nodes: typing.List[GraphNode]
+    """The object each node index represents."""
+
+    node_ids: typing.Dict[uuid.UUID, int]
+    """The node index of each object, by UUID."""
+
+    kind_ranges: typing.Dict[GraphNodeKind, range]
+    """The node indices of each kind of node."""
+
+    content_offsets: array.array
+    """The contents of node ``i`` are ``content_targets[content_offsets[i]:content_offsets[i + 1]]``."""
+
+    content_targets: array.array
+    """The node indices each node contains, sorted, grouped by node. See `Graph.content_offsets`."""
+
+    container_offsets: array.array
+    """The containers of node ``i`` are ``container_targets[container_offsets[i]:container_offsets[i + 1]]``."""
+
+    container_targets: array.array
+    """The node indices each node is contained by, sorted, grouped by node. See `Graph.container_offsets`."""
+
+    def __init__(
+        self,
+        *,
+        nodes: typing.List[GraphNode],
+        kind_ranges: typing.Dict[GraphNodeKind, range],
+        content_offsets: array.array,
+        content_targets: array.array,
+        container_offsets: array.array,
+        container_targets: array.array,
+    ) -> None:
+        self.nodes = nodes
+        self.node_ids = {node.id: i for i, node in enumerate(nodes)}
+        self.kind_ranges = kind_ranges
+        self.content_offsets = content_offsets
+        self.content_targets = content_targets
+        self.container_offsets = container_offsets
+        self.container_targets = container_targets
+
+    def index(self, node: GraphNode) -> int:
+        """Gets the node index of a card, set, series, pack distribution, or sealed product."""
+        return self.node_ids[node.id]
+
+    def kind(self, i: int) -> GraphNodeKind:
+        """Gets what kind of thing a node index represents."""
+        for kind, indices in self.kind_ranges.items():
+            if i in indices:
+                return kind
+        raise IndexError(i)
+
+    def contents(self, i: int) -> array.array:
+        """Gets the node indices directly contained by a node."""
+        return self.content_targets[
+            self.content_offsets[i] : self.content_offsets[i + 1]
+        ]
+
+    def containers(self, i: int) -> array.array:
+        """Gets the node indices that directly contain a node."""
+        return self.container_targets[
+            self.container_offsets[i] : self.container_offsets[i + 1]
+        ]
+
+    def _walk(
+        self,
+        start: int,
+        offsets: array.array,
+        targets: array.array,
+        kind: typing.Optional[GraphNodeKind],
+    ) -> typing.List[int]:
+        seen = bytearray(len(self.nodes))
+        seen[start] = 1
+        stack = [start]
+        while stack:
+            i = stack.pop()
+            for j in targets[offsets[i] : offsets[i + 1]]:
+                if not seen[j]:
+                    seen[j] = 1
+                    stack.append(j)
+        seen[start] = 0
+        indices = self.kind_ranges[kind] if kind else range(len(self.nodes))
+        return [i for i in indices if seen[i]]
+
+    def all_contents(
+        self, i: int, kind: typing.Optional[GraphNodeKind] = None
+    ) -> typing.List[int]:
+        """Gets the node indices a node contains, directly or indirectly.
+        For example, all the cards obtainable from a sealed product.
+
+        :param kind: If given, only return nodes of this kind.
+        """
+        return self._walk(i, self.content_offsets, self.content_targets, kind)
+
+    def all_containers(
+        self, i: int, kind: typing.Optional[GraphNodeKind] = None
+    ) -> typing.List[int]:
+        """Gets the node indices a node is contained in, directly or indirectly.
+        For example, all the sealed products a card can be obtained from.
+
+        :param kind: If given, only return nodes of this kind.
+        """
+        return self._walk(i, self.container_offsets, self.container_targets, kind)
+
+
+def _csr(
+    edges: typing.List[typing.Set[int]],
+) -> typing.Tuple[array.array, array.array]:
+    offsets = array.array("I", [0])
+    targets = array.array("I")
+    for dests in edges:
+        targets.extend(sorted(dests))
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def build_graph(db: Database) -> Graph:
+    """Builds a :class:`Graph` of the current contents of a database."""
+
+    nodes: typing.List[GraphNode] = []
+    kind_ranges: typing.Dict[GraphNodeKind, range] = {}
+    for kind, things in [
+        (GraphNodeKind.CARD, db.cards),
+        (GraphNodeKind.SET, db.sets),
+        (GraphNodeKind.SERIES, db.series),
+        (GraphNodeKind.DISTRO, db.distros),
+        (GraphNodeKind.PRODUCT, db.products),
+    ]:
+        kind_ranges[kind] = range(len(nodes), len(nodes) + len(things))
+        nodes.extend(things)
+    node_ids = {node.id: i for i, node in enumerate(nodes)}
+
+    edges: typing.List[typing.Set[int]] = [set() for _ in nodes]
+    for i in kind_ranges[GraphNodeKind.SET]:
+        set_: Set = nodes[i]
+        for contents in set_.contents:
+            for printing in [*contents.cards, *contents.removed_cards]:
+                edges[i].add(node_ids[printing.card.id])
+            if isinstance(contents.distrobution, uuid.UUID):
+                edges[i].add(node_ids[contents.distrobution])
+    for i in kind_ranges[GraphNodeKind.SERIES]:
+        series: Series = nodes[i]
+        for card in series.members:
+            edges[i].add(node_ids[card.id])
+    for i in kind_ranges[GraphNodeKind.DISTRO]:
+        distro: PackDistrobution = nodes[i]
+        for slot in distro.slots:
+            if isinstance(slot, PackDistroSlotCards):
+                for printing in slot.cards:
+                    edges[i].add(node_ids[printing.card.id])
+            elif isinstance(slot, PackDistroSlotSet):
+                edges[i].add(node_ids[slot.set.id])
+            elif isinstance(slot, PackDistroSlotPool) and slot.set:
+                edges[i].add(node_ids[slot.set.id])
+    for i in kind_ranges[GraphNodeKind.PRODUCT]:
+        product: SealedProduct = nodes[i]
+        for contents in product.contents:
+            for pack in contents.packs:
+                if pack.card:
+                    edges[i].add(node_ids[pack.card.id])
+                else:
+                    edges[i].add(node_ids[pack.set.id])
+        for set_ in product.box_of:
+            edges[i].add(node_ids[set_.id])
+
+    reverse_edges: typing.List[typing.Set[int]] = [set() for _ in nodes]
+    for i, dests in enumerate(edges):
+        for j in dests:
+            reverse_edges[j].add(i)
+
+    content_offsets, content_targets = _csr(edges)
+    container_offsets, container_targets = _csr(reverse_edges)
+    return Graph(
+        nodes=nodes,
+        kind_ranges=kind_ranges,
+        content_offsets=content_offsets,
+        content_targets=content_targets,
+        container_offsets=container_offsets,
+        container_targets=container_targets,
+    )
@@ -163,82 +163,87 @@ def _write_card(
     in_json: typing.Dict[str, typing.Any],
     card: Card,
     series_map: typing.Dict[str, typing.List[Card]],
-) -> Card:
+) -> bool:
     """
     Converts a Yaml Yugi card into a YGOJSON card.
     Overwrites any fields that have changed.
     Use an empty dict to represent a new card.
+    Returns True if anything changed.
     """
 
+    changed = False
     for rawlang, text in in_json["name"].items():
         if "_" in rawlang:
             continue
         lang = Language.normalize(rawlang)
         if text is not None:
-            if lang not in card.text:
-                card.text[lang] = CardText(name=text)
-            else:
-                card.text[lang].name = text
+            changed |= update_card_text(card, lang, name=text)
     for rawlang, text in in_json.get("text", {}).items():
         if "_" in rawlang:
             continue
         lang = Language.normalize(rawlang)
         if text is not None:
-            card.text[lang].effect = text
+            changed |= update_card_text(card, lang, effect=text)
     for rawlang, text in in_json.get("pendulum_effect", {}).items():
         if "_" in rawlang:
             continue
         lang = Language.normalize(rawlang)
         if text is not None:
-            card.text[lang].pendulum_effect = text
+            changed |= update_card_text(card, lang, pendulum_effect=text)
 
     if card.card_type == CardType.MONSTER:
         # monster
         typeline = [s.strip() for s in in_json["monster_type_line"].split(" / ")]
 
-        card.attribute = Attribute(in_json["attribute"].lower())
+        changed |= update_field(
+            card, "attribute", Attribute(in_json["attribute"].lower())
+        )
 
-        card.monster_card_types = []
-        for k, v in MONSTER_CARD_TYPES.items():
-            if k in typeline:
-                card.monster_card_types.append(v)
+        changed |= update_field(
+            card,
+            "monster_card_types",
+            [v for k, v in MONSTER_CARD_TYPES.items() if k in typeline],
+        )
 
-        card.type = None
-        for k, v in TYPES.items():
-            if k in typeline:
-                card.type = v
-                break
-        if not card.type:
+        race = next((v for k, v in TYPES.items() if k in typeline), None)
+        if not race:
             logging.warn(
                 f"Card {card.text[Language.ENGLISH].name} has no race! Typeline: {in_json['monster_type_line']}"
             )
-            card.type = Race.CREATORGOD
+            race = Race.CREATORGOD
+        changed |= update_field(card, "type", race)
 
-        card.classifications = []
-        for k, v in CLASSIFICATIONS.items():
-            if k in typeline:
-                card.classifications.append(v)
+        changed |= update_field(
+            card,
+            "classifications",
+            [v for k, v in CLASSIFICATIONS.items() if k in typeline],
+        )
 
-        card.abilities = []
-        for k, v in ABILITIES.items():
-            if k in typeline:
-                card.abilities.append(v)
+        changed |= update_field(
+            card, "abilities", [v for k, v in ABILITIES.items() if k in typeline]
+        )
 
         if "level" in in_json:
-            card.level = in_json["level"]
+            changed |= update_field(card, "level", in_json["level"])
         if "rank" in in_json:
-            card.rank = in_json["rank"]
-        card.atk = in_json["atk"]
+            changed |= update_field(card, "rank", in_json["rank"])
+        changed |= update_field(card, "atk", in_json["atk"])
         if "def" in in_json:
-            card.def_ = in_json["def"]
+            changed |= update_field(card, "def_", in_json["def"])
         if "pendulum_scale" in in_json:
-            card.scale = in_json["pendulum_scale"]
+            changed |= update_field(card, "scale", in_json["pendulum_scale"])
         if "link_arrows" in in_json:
-            card.link_arrows = [LINK_ARROWS[x] for x in in_json["link_arrows"]]
+            changed |= update_field(
+                card,
+                "link_arrows",
+                [LINK_ARROWS[x] for x in in_json["link_arrows"]],
+            )
     else:
         # spell/trap
-        card.subcategory = SubCategory(
-            in_json.get("property", "normal").lower().replace("-", "")
+        changed |= update_field(
+            card,
+            "subcategory",
+            SubCategory(in_json.get("property", "normal").lower().replace("-", "")),
         )
 
     if (
@@ -249,6 +254,7 @@ def _write_card(
         password = "%08u" % (in_json["password"],)
         if password not in card.passwords:
             card.passwords.append(password)
+            changed = True
 
     # we skip images here:
     # they're just links to unresolved Yugipedia images,
@@ -269,12 +275,17 @@ def _write_card(
             continue
         fmt = Format(k)
         if fmt in card.legality:
-            card.legality[fmt].legality = LEGALITIES[v]
+            changed |= update_field(card.legality[fmt], "legality", LEGALITIES[v])
         else:
             card.legality[fmt] = CardLegality(legality=LEGALITIES[v])
+            changed = True
 
     if "master_duel_rarity" in in_json:
-        card.master_duel_rarity = VideoGameRaity(in_json["master_duel_rarity"].lower())
+        changed |= update_field(
+            card,
+            "master_duel_rarity",
+            VideoGameRaity(in_json["master_duel_rarity"].lower()),
+        )
 
     yugipedia_id = in_json["yugipedia_page_id"]
     if not card.yugipedia_pages:
@@ -282,14 +293,15 @@ def _write_card(
     if not any(x.id == yugipedia_id for x in card.yugipedia_pages):
         # TODO: validate that none of these ""s are left after Yugipedia runs
         card.yugipedia_pages.append(ExternalIdPair("", yugipedia_id))
-    card.db_id = in_json["konami_id"]
-    card.yamlyugi_id = in_json["password"]
+        changed = True
+    changed |= update_field(card, "db_id", in_json["konami_id"])
+    changed |= update_field(card, "yamlyugi_id", in_json["password"])
 
     for series in in_json.get("series", []):
         series_map.setdefault(series, [])
         series_map[series].append(card)
 
-    return card
+    return changed
 
 
 def _import_card(
@@ -383,8 +395,8 @@ def import_from_yaml_yugi(
                 n_existing += 1
             else:
                 n_new += 1
-            card = _write_card(db, in_card, card, series_map)
-            db.add_card(card)
+            if _write_card(db, in_card, card, series_map) or not found:
+                db.add_card(card)
 
     if import_series:
         for in_series in tqdm.tqdm(
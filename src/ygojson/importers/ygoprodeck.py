@@ -156,57 +156,73 @@ def _import_card(
     return False, Card(id=uuid.uuid4(), card_type=cardtype)
 
 
-def _write_card(in_json: typing.Dict[str, typing.Any], card: Card) -> Card:
+def _write_card(in_json: typing.Dict[str, typing.Any], card: Card) -> bool:
     """
     Converts a YGOProDeck card into a YGOJSON card.
     Overwrites any fields that have changed.
+    Returns True if anything changed.
     """
 
-    card.text.setdefault(Language.ENGLISH, CardText(name=in_json["name"]))
+    changed = update_card_text(
+        card,
+        Language.ENGLISH,
+        name=None if Language.ENGLISH in card.text else in_json["name"],
+        effect=in_json.get("desc") or None,
+        pendulum_effect=in_json.get("pend_desc") or None,
+    )
     en_text = card.text[Language.ENGLISH]
-    en_text.effect = in_json.get("desc") or en_text.effect
-    en_text.pendulum_effect = in_json.get("pend_desc") or en_text.pendulum_effect
 
     if card.card_type in {CardType.MONSTER, CardType.TOKEN}:
         typeline = in_json["type"].split(" ")
 
-        card.attribute = (
-            Attribute(in_json["attribute"].lower()) if "attribute" in in_json else None
+        changed |= update_field(
+            card,
+            "attribute",
+            Attribute(in_json["attribute"].lower()) if "attribute" in in_json else None,
+        )
+        changed |= update_field(
+            card,
+            "monster_card_types",
+            [v for i, v in MONSTER_CARD_TYPES.items() if i in typeline],
+        )
+        changed |= update_field(
+            card,
+            "type",
+            Race(in_json["race"].lower().replace("-", "").replace(" ", "")),
+        )
+        changed |= update_field(
+            card,
+            "classifications",
+            [v for i, v in CLASSIFICATIONS.items() if i in typeline],
+        )
+        changed |= update_field(
+            card, "abilities", [v for i, v in ABILITIES.items() if i in typeline]
         )
-        card.monster_card_types = []
-        for i, v in MONSTER_CARD_TYPES.items():
-            if i in typeline:
-                card.monster_card_types.append(v)
-        card.type = Race(in_json["race"].lower().replace("-", "").replace(" ", ""))
-        card.classifications = []
-        for i, v in CLASSIFICATIONS.items():
-            if i in typeline:
-                card.classifications.append(v)
-        card.abilities = []
-        for i, v in ABILITIES.items():
-            if i in typeline:
-                card.abilities.append(v)
         if MonsterCardType.XYZ in (card.monster_card_types or []):
-            card.rank = in_json.get("level")
+            changed |= update_field(card, "rank", in_json.get("level"))
         else:
-            card.level = in_json.get("level")
+            changed |= update_field(card, "level", in_json.get("level"))
         if "atk" in in_json:
             if type(in_json["atk"]) is int or in_json["atk"] == "?":
-                card.atk = in_json["atk"]
+                changed |= update_field(card, "atk", in_json["atk"])
             else:
                 logging.warn(f"Card {en_text.name} has bad ATK: {in_json.get('atk')}")
         if "def" in in_json:
             if in_json["def"] is None:
                 pass  # link monsters now have null def
             elif type(in_json["def"]) is int or in_json["def"] == "?":
-                card.def_ = in_json["def"]
+                changed |= update_field(card, "def_", in_json["def"])
             else:
                 logging.warn(f"Card {en_text.name} has bad DEF: {in_json.get('def')}")
 
     if card.card_type == CardType.MONSTER:
-        card.scale = in_json.get("scale")
+        changed |= update_field(card, "scale", in_json.get("scale"))
         if MonsterCardType.LINK in (card.monster_card_types or []):
-            card.link_arrows = [LINK_ARROWS[x] for x in in_json["linkmarkers"]]
+            changed |= update_field(
+                card,
+                "link_arrows",
+                [LINK_ARROWS[x] for x in in_json["linkmarkers"]],
+            )
     elif card.card_type in {CardType.SPELL, CardType.TRAP}:
         if in_json.get("race"):
             raw_race = in_json["race"].lower().replace("-", "")
@@ -215,12 +231,12 @@ def _write_card(in_json: typing.Dict[str, typing.Any], card: Card) -> Card:
                     f"Found seplltrap with bad subcategory {en_text.name or in_json['id']}: {raw_race}"
                 )
             else:
-                card.subcategory = SubCategory(raw_race)
+                changed |= update_field(card, "subcategory", SubCategory(raw_race))
     elif card.card_type == CardType.TOKEN:
         pass
     elif card.card_type == CardType.SKILL:
         if in_json.get("race"):
-            card.character = in_json["race"]
+            changed |= update_field(card, "character", in_json["race"])
     else:
         logging.warn(f"Unknown card type for {en_text.name}: {card.card_type}")
 
@@ -230,6 +246,7 @@ def _write_card(in_json: typing.Dict[str, typing.Any], card: Card) -> Card:
         password = "%08u" % (in_json["id"],)
         if password not in card.passwords:
             card.passwords.append(password)
+            changed = True
 
     for in_image in in_json.get("card_images") or []:
         # image IDs are either the password of the art variant,
@@ -249,27 +266,40 @@ def _write_card(in_json: typing.Dict[str, typing.Any], card: Card) -> Card:
         if not existing_image:
             existing_image = CardImage(id=uuid.uuid4())
             card.images.append(existing_image)
+            changed = True
 
         if in_image["id"] in card.passwords or len(card.passwords) == 1:
             # because of Dark Magician,
             # we can't associate alt arts w/o a unique password here with the primary password.
-            existing_image.password = "%08u" % (in_image["id"],)
-        existing_image.card_art = in_image["image_url"]
-        existing_image.crop_art = in_image["image_url_cropped"]
+            changed |= update_field(
+                existing_image, "password", "%08u" % (in_image["id"],)
+            )
+        changed |= update_field(existing_image, "card_art", in_image["image_url"])
+        changed |= update_field(
+            existing_image, "crop_art", in_image["image_url_cropped"]
+        )
 
-    card.ygoprodeck = ExternalIdPair(
-        in_json["ygoprodeck_url"].replace("https://ygoprodeck.com/card/", ""),
-        in_json["id"],
+    ygoprodeck_name = in_json["ygoprodeck_url"].replace(
+        "https://ygoprodeck.com/card/", ""
     )
+    if (
+        not card.ygoprodeck
+        or card.ygoprodeck.name != ygoprodeck_name
+        or card.ygoprodeck.id != in_json["id"]
+    ):
+        card.ygoprodeck = ExternalIdPair(ygoprodeck_name, in_json["id"])
+        changed = True
     if "misc_info" in in_json and len(in_json["misc_info"]) > 0:
         if len(in_json["misc_info"]) == 1:
-            card.db_id = in_json["misc_info"][0].get("konami_id", card.db_id)
+            changed |= update_field(
+                card, "db_id", in_json["misc_info"][0].get("konami_id", card.db_id)
+            )
         else:
             logging.warn(
                 f"Card {en_text.name} has {len(in_json['misc_info'])} misc_infos!"
             )
 
-    return card
+    return changed
 
 
 def import_from_ygoprodeck(
@@ -296,8 +326,8 @@ def import_from_ygoprodeck(
                     n_existing += 1
                 else:
                     n_new += 1
-                card = _write_card(in_card, card)
-                db.add_card(card)
+                if _write_card(in_card, card) or not found:
+                    db.add_card(card)
             except InvalidCardImport:
                 pass
 
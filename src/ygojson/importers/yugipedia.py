@@ -2879,6 +2879,9 @@ def import_from_yugipedia(
         )  # to ensure we never lose cache data
 
         series_members: typing.Dict[str, typing.Set[Card]] = {}
+        # video game sets get their cards added in callbacks that may run after add_set,
+        # so they're added again once every callback has run, to update card backlinks
+        video_game_sets: typing.List[Set] = []
 
         if partition_filepath is None:
             # process everything we can get our grubby mitts on
@@ -3113,6 +3116,7 @@ def import_from_yugipedia(
                                 ):
                                     nonlocal n_found, n_new
                                     db.add_set(set_)
+                                    video_game_sets.append(set_)
                                     if found:
                                         n_found += 1
                                     else:
@@ -3144,6 +3148,7 @@ def import_from_yugipedia(
                                 ):
                                     nonlocal n_found, n_new
                                     db.add_set(set_)
+                                    video_game_sets.append(set_)
                                     if found:
                                         n_found += 1
                                     else:
@@ -3226,6 +3231,9 @@ def import_from_yugipedia(
 
                 do(seriesid)
 
+    for set_ in video_game_sets:
+        db.add_set(set_)
+
     return n_found, n_new
 
 
@@ -0,0 +1,105 @@
+# Measure how much memory a database takes up, broken down by the types and fields it is stored in.
+
+import collections.abc
+import enum
+import sys
+import typing
+
+from .database import *
+
+MemoryUsage = typing.Dict[str, typing.Dict[str, int]]
+"""Bytes of memory used, keyed by type name and then by field name.
+The field ``"(object)"`` is the size of the objects themselves, not counting what their fields refer to.
+"""
+
+
+def _is_ours(thing: typing.Any) -> bool:
+    return type(thing).__module__.startswith("ygojson.") and not isinstance(
+        thing, enum.Enum
+    )
+
+
+def _fields(thing: typing.Any) -> typing.Iterable[typing.Tuple[str, typing.Any]]:
+    for clazz in type(thing).__mro__:
+        for slot in getattr(clazz, "__slots__", ()):
+            if hasattr(thing, slot):
+                yield slot.lstrip("_") or slot, getattr(thing, slot)
+    yield from getattr(thing, "__dict__", {}).items()
+
+
+def memory_usage(db: Database) -> MemoryUsage:
+    """Walks everything reachable from a database, and totals up the memory it uses.
+
+    Each object is only counted once, for the first field found referring to it.
+    Cards, sets, series, pack distributions, and sealed products are walked first, in that order,
+    then the database itself, so the ``Database`` fields are how much memory the indexes add.
+    Fields of the objects that make up cards, sets, etc. are counted under their own types;
+    for example, ``CardText.effect`` is counted separately from ``Card.text``.
+    Collections such as :class:`LegalityHistory` and :class:`Backlinks` are counted as part of the field holding them.
+    Enum members are shared, so they are not counted.
+    """
+
+    usage: MemoryUsage = {}
+    roots: typing.List[typing.Any] = [
+        *db.cards,
+        *db.sets,
+        *db.series,
+        *db.distros,
+        *db.products,
+    ]
+    seen: typing.Set[int] = {id(x) for x in roots}
+
+    for root in [*roots, db]:
+        stack: typing.List[typing.Tuple[typing.Any, typing.Dict[str, int], str]] = [
+            (root, {}, "")
+        ]
+        while stack:
+            thing, fields, field = stack.pop()
+            if _is_ours(thing) and not isinstance(thing, collections.abc.Collection):
+                fields = usage.setdefault(type(thing).__name__, {})
+                size = sys.getsizeof(thing)
+                if hasattr(thing, "__dict__"):
+                    size += sys.getsizeof(thing.__dict__)
+                fields["(object)"] = fields.get("(object)", 0) + size
+                for child_field, child in _fields(thing):
+                    if id(child) not in seen and not isinstance(child, enum.Enum):
+                        seen.add(id(child))
+                        stack.append((child, fields, child_field))
+                continue
+
+            fields[field] = fields.get(field, 0) + sys.getsizeof(thing)
+            children: typing.Iterable[typing.Any] = ()
+            if isinstance(thing, dict):
+                children = [*thing.keys(), *thing.values()]
+            elif isinstance(thing, (list, tuple, set, frozenset)):
+                children = thing
+            elif _is_ours(thing):
+                # collections of our own, such as Backlinks, count towards the field holding them
+                children = [x for _, x in _fields(thing)]
+            for child in children:
+                if id(child) not in seen and not isinstance(child, enum.Enum):
+                    seen.add(id(child))
+                    stack.append((child, fields, field))
+
+    return usage
+
+
+def format_memory_usage(usage: MemoryUsage) -> str:
+    """Formats the result of `memory_usage` as a table, with the biggest fields first."""
+
+    rows = sorted(
+        (
+            (size, type_name, field)
+            for type_name, fields in usage.items()
+            for field, size in fields.items()
+        ),
+        reverse=True,
+    )
+    total = sum(size for size, _, _ in rows)
+    lines = [f"{'field':<48}{'MiB':>10}{'%':>8}"]
+    for size, type_name, field in rows:
+        lines.append(
+            f"{type_name + '.' + field:<48}{size / 2**20:>10.2f}{100 * size / (total or 1):>8.1f}"
+        )
+    lines.append(f"{'total':<48}{total / 2**20:>10.2f}{100.0:>8.1f}")
+    return "\n".join(lines)
@@ -0,0 +1,278 @@
+# Read and validate decks in the .ydk format used by YGOPro-derived simulators.
+
+import datetime
+import os
+import os.path
+import typing
+
+from .database import *
+
+YDK_EXTENSION = ".ydk"
+
+MAX_COPIES = {
+    Legality.UNLIMITED: 3,
+    Legality.SEMILIMITED: 2,
+    Legality.LIMITED: 1,
+    Legality.FORBIDDEN: 0,
+    Legality.LIMIT1: 3,
+    Legality.LIMIT2: 3,
+    Legality.LIMIT3: 3,
+    Legality.UNRELEASED: 0,
+    Legality.UNKNOWN: 0,
+}
+"""How many copies of a card of each legality can be in a deck."""
+
+LIMIT_GROUPS = {
+    Legality.LIMIT1: 1,
+    Legality.LIMIT2: 2,
+    Legality.LIMIT3: 3,
+}
+"""For Speed Duel / Duel Links limits: how many cards of each limit can be in a deck in total."""
+
+
+class Deck:
+    """A deck, as read from a .ydk file. Cards are given as passwords."""
+
+    name: str
+    """The name of the deck. By default, the name of the file it was read from."""
+
+    main: typing.List[str]
+    """The passwords of the cards in the main deck."""
+
+    extra: typing.List[str]
+    """The passwords of the cards in the extra deck."""
+
+    side: typing.List[str]
+    """The passwords of the cards in the side deck."""
+
+    def __init__(
+        self,
+        *,
+        name: str = "",
+        main: typing.Optional[typing.List[str]] = None,
+        extra: typing.Optional[typing.List[str]] = None,
+        side: typing.Optional[typing.List[str]] = None,
+    ):
+        self.name = name
+        self.main = main or []
+        self.extra = extra or []
+        self.side = side or []
+
+    @property
+    def passwords(self) -> typing.Iterable[str]:
+        """All the passwords in the deck: main, extra, and side."""
+        yield from self.main
+        yield from self.extra
+        yield from self.side
+
+
+def read_ydk(file: typing.Iterable[str], name: str = "") -> Deck:
+    """Reads a deck from the lines of a .ydk file."""
+
+    deck = Deck(name=name)
+    section = deck.main
+    for line in file:
+        line = line.strip()
+        if not line:
+            continue
+        if line == "#main":
+            section = deck.main
+        elif line == "#extra":
+            section = deck.extra
+        elif line == "!side":
+            section = deck.side
+        elif line[0] in "#!":
+            continue  # comment, or a section we don't know about
+        elif line.isascii() and line.isdigit():
+            section.append("%08u" % (int(line),))
+    return deck
+
+
+def load_ydk(path: str) -> Deck:
+    """Reads a deck from a .ydk file on disk."""
+
+    with open(path, encoding="utf-8", errors="replace") as file:
+        return read_ydk(file, os.path.splitext(os.path.basename(path))[0])
+
+
+def load_ydk_dir(path: str) -> typing.Iterable[Deck]:
+    """Reads all the .ydk files in a directory, one at a time."""
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(YDK_EXTENSION):
+                yield load_ydk(entry.path)
+
+
+class DeckViolation:
+    """A reason a deck is not legal: too many copies of a card."""
+
+    card: Card
+    """The card there are too many copies of."""
+
+    copies: int
+    """How many copies of the card the deck has."""
+
+    max_copies: int
+    """How many copies of the card the deck is allowed."""
+
+    legality: typing.Optional[Legality]
+    """The legality of the card. None if it has no known legality in the format."""
+
+    def __init__(
+        self,
+        *,
+        card: Card,
+        copies: int,
+        max_copies: int,
+        legality: typing.Optional[Legality],
+    ):
+        self.card = card
+        self.copies = copies
+        self.max_copies = max_copies
+        self.legality = legality
+
+
+class DeckReport:
+    """The result of validating a :class:`Deck` with a :class:`DeckValidator`."""
+
+    deck: Deck
+    """The deck validated."""
+
+    violations: typing.List[DeckViolation]
+    """Cards the deck has too many copies of."""
+
+    limit_violations: typing.Dict[Legality, int]
+    """Speed Duel / Duel Links limits the deck has too many cards of, and how many it has."""
+
+    unknown_passwords: typing.List[str]
+    """Passwords in the deck that did not match any card."""
+
+    points: float
+    """The total point value of the deck, for formats that use points."""
+
+    def __init__(self, *, deck: Deck):
+        self.deck = deck
+        self.violations = []
+        self.limit_violations = {}
+        self.unknown_passwords = []
+        self.points = 0
+
+    @property
+    def legal(self) -> bool:
+        """True if the deck has no violations and all its cards are known."""
+        return (
+            not self.violations
+            and not self.limit_violations
+            and not self.unknown_passwords
+        )
+
+
+class DeckValidator:
+    """Checks decks against the legality of a single format as of a single date.
+
+    The legality and point value of each card is only looked up once,
+    so reuse one validator for as many decks as possible.
+    """
+
+    db: Database
+    """The database cards are looked up in."""
+
+    format: Format
+    """The format decks are checked against."""
+
+    date: typing.Optional[datetime.date]
+    """The date decks are checked as of. If None, current legality is used."""
+
+    _rulings: typing.Dict[
+        str, typing.Optional[typing.Tuple[Card, int, typing.Optional[Legality], float]]
+    ]
+
+    def __init__(
+        self,
+        db: Database,
+        format: Format,
+        date: typing.Optional[datetime.date] = None,
+    ):
+        self.db = db
+        self.format = format
+        self.date = date
+        self._rulings = {}
+
+    def _ruling(
+        self, password: str
+    ) -> typing.Optional[typing.Tuple[Card, int, typing.Optional[Legality], float]]:
+        if password in self._rulings:
+            return self._rulings[password]
+
+        card = self.db.cards_by_password.get(password)
+        if not card:
+            ruling = None
+        else:
+            legality: typing.Optional[Legality]
+            points: typing.Optional[float]
+            if card.illegal:
+                legality, points = Legality.FORBIDDEN, None
+            elif self.date:
+                legality = self.db.legality_at(card, self.format, self.date)
+                points = self.db.points_at(card, self.format, self.date)
+            elif self.format in card.legality:
+                legality = card.legality[self.format].legality
+                points = card.legality[self.format].points
+            else:
+                legality, points = None, None
+            max_copies = MAX_COPIES[legality] if legality else 0
+            ruling = (card, max_copies, legality, points or 0)
+
+        self._rulings[password] = ruling
+        return ruling
+
+    def validate(self, deck: Deck) -> DeckReport:
+        """Checks a deck for legality, and totals its points."""
+
+        report = DeckReport(deck=deck)
+        copies: typing.Dict[Card, int] = {}
+        rulings: typing.Dict[
+            Card, typing.Tuple[Card, int, typing.Optional[Legality], float]
+        ] = {}
+        for password in deck.passwords:
+            ruling = self._ruling(password)
+            if not ruling:
+                report.unknown_passwords.append(password)
+                continue
+            card = ruling[0]
+            copies[card] = copies.get(card, 0) + 1
+            rulings[card] = ruling
+            report.points += ruling[3]
+
+        limits: typing.Dict[Legality, int] = {}
+        for card, n in copies.items():
+            _, max_copies, legality, _ = rulings[card]
+            if n > max_copies:
+                report.violations.append(
+                    DeckViolation(
+                        card=card, copies=n, max_copies=max_copies, legality=legality
+                    )
+                )
+            if legality in LIMIT_GROUPS:
+                limits[legality] = limits.get(legality, 0) + n
+        for legality, n in limits.items():
+            if n > LIMIT_GROUPS[legality]:
+                report.limit_violations[legality] = n
+
+        return report
+
+
+def validate_ydk_dir(
+    db: Database,
+    path: str,
+    format: Format,
+    date: typing.Optional[datetime.date] = None,
+) -> typing.Iterable[DeckReport]:
+    """Validates every .ydk file in a directory against a format, one at a time.
+    See :class:`DeckValidator`.
+    """
+
+    validator = DeckValidator(db, format, date)
+    for deck in load_ydk_dir(path):
+        yield validator.validate(deck)
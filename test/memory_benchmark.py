@@ -0,0 +1,69 @@
+import collections
+import gc
+import os.path
+import sys
+import tracemalloc
+import typing
+
+import ygojson
+
+SLOTTED_CLASSES = [
+    ygojson.Card,
+    ygojson.CardText,
+    ygojson.CardImage,
+    ygojson.LegalityPeriod,
+    ygojson.CardLegality,
+    ygojson.CardPrinting,
+    ygojson.PrintingLocation,
+    ygojson.SetContents,
+    ygojson.SetLocale,
+    ygojson.PackDistroWeight,
+    ygojson.ExternalIdPair,
+]
+
+
+def main(argv: typing.List[str]) -> int:
+    aggregates_dir = argv[1] if len(argv) > 1 else ygojson.AGGREGATE_DIR
+    if not os.path.exists(aggregates_dir):
+        print(f"No aggregate data found in {aggregates_dir}; run ygojson first.")
+        return 1
+
+    gc.collect()
+    tracemalloc.start()
+    db = ygojson.load_from_file(aggregates_dir=aggregates_dir, intern_strings=False)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    print(f"Heap after load: {current / 2**20:.1f} MiB (peak {peak / 2**20:.1f} MiB)")
+
+    saved = db.intern_strings()
+    gc.collect()
+    interned, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"Heap after interning strings: {interned / 2**20:.1f} MiB"
+        f" ({(current - interned) / 2**20:.1f} MiB less; {saved / 2**20:.1f} MiB of distinct duplicate strings dropped)"
+    )
+    print()
+
+    counts: typing.Dict[type, int] = collections.Counter()
+    samples: typing.Dict[type, typing.Any] = {}
+    for thing in gc.get_objects():
+        if type(thing) in SLOTTED_CLASSES:
+            counts[type(thing)] += 1
+            samples.setdefault(type(thing), thing)
+
+    print(f"{'class':<20}{'instances':>12}{'bytes each':>12}{'total MiB':>12}")
+    for clazz in SLOTTED_CLASSES:
+        size = sys.getsizeof(samples[clazz]) if clazz in samples else 0
+        if hasattr(samples.get(clazz), "__dict__"):
+            size += sys.getsizeof(samples[clazz].__dict__)
+        n = counts[clazz]
+        print(f"{clazz.__name__:<20}{n:>12}{size:>12}{n * size / 2**20:>12.1f}")
+    print()
+
+    print(ygojson.format_memory_usage(ygojson.memory_usage(db)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
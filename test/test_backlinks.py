@@ -0,0 +1,54 @@
+import uuid
+
+import ygojson
+
+
+def _card(name: str) -> ygojson.Card:
+    return ygojson.Card(
+        id=uuid.uuid4(),
+        card_type=ygojson.CardType.MONSTER,
+        text={ygojson.Language.ENGLISH: ygojson.CardText(name=name)},
+    )
+
+
+def test_backlinks_follow_contents_added_after_add_set():
+    db = ygojson.Database()
+    first, second = _card("First"), _card("Second")
+    db.add_card(first)
+    db.add_card(second)
+    contents = ygojson.SetContents(formats=[ygojson.Format.MASTERDUEL])
+    set_ = ygojson.Set(
+        id=uuid.uuid4(), name={ygojson.Language.ENGLISH: "Pack"}, contents=[contents]
+    )
+    db.add_set(set_)
+    assert set_ not in first.sets
+
+    # the Yugipedia importer fills in Master Duel and Duel Links sets like this
+    contents.cards.append(ygojson.CardPrinting(id=uuid.uuid4(), card=first))
+    contents.cards.append(ygojson.CardPrinting(id=uuid.uuid4(), card=first))
+    db.add_set(set_)
+    assert first.sets.count(set_) == 2
+    assert set_ not in second.sets
+
+    del contents.cards[:]
+    contents.cards.append(ygojson.CardPrinting(id=uuid.uuid4(), card=second))
+    db.add_set(set_)
+    assert set_ not in first.sets
+    assert second.sets.count(set_) == 1
+
+
+def test_regenerate_backlinks_matches_add_set():
+    db = ygojson.Database()
+    card = _card("Card")
+    db.add_card(card)
+    contents = ygojson.SetContents()
+    set_ = ygojson.Set(
+        id=uuid.uuid4(), name={ygojson.Language.ENGLISH: "Pack"}, contents=[contents]
+    )
+    db.add_set(set_)
+    contents.cards.append(ygojson.CardPrinting(id=uuid.uuid4(), card=card))
+
+    db.regenerate_backlinks()
+    assert card.sets.count(set_) == 1
+    db.add_set(set_)
+    assert card.sets.count(set_) == 1
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import uuid
+
+import ygojson
+
+
+def _card(name: str) -> ygojson.Card:
+    return ygojson.Card(
+        id=uuid.uuid4(),
+        card_type=ygojson.CardType.MONSTER,
+        text={ygojson.Language.ENGLISH: ygojson.CardText(name=name)},
+    )
+
+
+def _contents(card: ygojson.Card, locale: ygojson.SetLocale) -> ygojson.SetContents:
+    return ygojson.SetContents(
+        locales=[locale],
+        cards=[ygojson.CardPrinting(id=uuid.uuid4(), card=card, suffix="001")],
+    )
+
+
+def test_readding_set_replaces_its_codes():
+    db = ygojson.Database()
+    first, second = _card("First"), _card("Second")
+    db.add_card(first)
+    db.add_card(second)
+    locale = ygojson.SetLocale(
+        key=ygojson.Locale.ENGLISH, language="en", prefix="LOB-EN"
+    )
+    set_ = ygojson.Set(
+        id=uuid.uuid4(),
+        name={ygojson.Language.ENGLISH: "Legend of Blue Eyes White Dragon"},
+        locales=[locale],
+        contents=[_contents(first, locale)],
+    )
+    db.add_set(set_)
+    assert [p.card for p in db.printings_by_code["LOB-EN001"]] == [first]
+
+    set_.contents = [_contents(second, locale)]
+    db.add_set(set_)
+    assert [p.card for p in db.printings_by_code["LOB-EN001"]] == [second]
+    assert db.resolve_identifiers(["LOB-EN001"])["LOB-EN001"].card is second
+    assert [p.card for p in db.printings_with_code_prefix("LOB-EN")["LOB-EN001"]] == [
+        second
+    ]
+    with tempfile.TemporaryDirectory() as dir:
+        ygojson.freeze(db, os.path.join(dir, "frozen.bin"))
+
+    locale.prefix = "LOB-E"
+    db.add_set(set_)
+    assert "LOB-EN001" not in db.printings_by_code
+    assert list(db.printings_with_code_prefix("LOB-EN")) == []
+    assert list(db.printings_with_code_prefix("LOB-E")) == ["LOB-E001"]
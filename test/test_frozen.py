@@ -0,0 +1,54 @@
+import gc
+import os
+import struct
+import tempfile
+import uuid
+import warnings
+
+import pytest
+
+import ygojson
+
+
+def _db() -> ygojson.Database:
+    db = ygojson.Database()
+    db.add_card(
+        ygojson.Card(
+            id=uuid.uuid4(),
+            card_type=ygojson.CardType.MONSTER,
+            text={ygojson.Language.ENGLISH: ygojson.CardText(name="Test Card")},
+            passwords=["00000001"],
+        )
+    )
+    return db
+
+
+def test_freeze_and_open():
+    db = _db()
+    with tempfile.TemporaryDirectory() as dir:
+        path = os.path.join(dir, "frozen.bin")
+        ygojson.freeze(db, path)
+        with ygojson.FrozenDatabase(path) as frozen:
+            assert frozen.count("cards") == 1
+            assert frozen.lookup_card_by_password("00000001") is not None
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        b"",
+        b"NOTFROZEN" * 4,
+        struct.pack("<8sI", ygojson.frozen.FROZEN_MAGIC, 999) + b"\0" * 16,
+    ],
+)
+def test_bad_file_is_closed(header: bytes):
+    with tempfile.TemporaryDirectory() as dir:
+        path = os.path.join(dir, "frozen.bin")
+        with open(path, "wb") as file:
+            file.write(header)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            with pytest.raises(ValueError):
+                ygojson.FrozenDatabase(path)
+            gc.collect()
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
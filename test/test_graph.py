@@ -0,0 +1,49 @@
+import uuid
+
+import ygojson
+
+
+def test_graph_follows_pool_slot_sets():
+    db = ygojson.Database()
+    card = ygojson.Card(
+        id=uuid.uuid4(),
+        card_type=ygojson.CardType.MONSTER,
+        text={ygojson.Language.ENGLISH: ygojson.CardText(name="Test Card")},
+    )
+    db.add_card(card)
+    pool_set = ygojson.Set(
+        id=uuid.uuid4(),
+        name={ygojson.Language.ENGLISH: "Pool Set"},
+        contents=[
+            ygojson.SetContents(
+                cards=[ygojson.CardPrinting(id=uuid.uuid4(), card=card)]
+            )
+        ],
+    )
+    db.add_set(pool_set)
+    distro = ygojson.PackDistrobution(
+        id=uuid.uuid4(), slots=[ygojson.PackDistroSlotPool(set=pool_set)]
+    )
+    db.add_distro(distro)
+    pack = ygojson.Set(
+        id=uuid.uuid4(),
+        name={ygojson.Language.ENGLISH: "Pack"},
+        contents=[ygojson.SetContents(distrobution=distro.id)],
+    )
+    db.add_set(pack)
+    product = ygojson.SealedProduct(
+        id=uuid.uuid4(),
+        name={ygojson.Language.ENGLISH: "Product"},
+        contents=[
+            ygojson.SealedProductContents(
+                packs={ygojson.SealedProductPack(set=pack): 1}
+            )
+        ],
+    )
+    db.add_product(product)
+
+    graph = ygojson.build_graph(db)
+    assert graph.index(pool_set) in graph.contents(graph.index(distro))
+    assert graph.all_contents(graph.index(product), ygojson.GraphNodeKind.CARD) == [
+        graph.index(card)
+    ]
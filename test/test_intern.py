@@ -0,0 +1,23 @@
+import sys
+import uuid
+
+import ygojson
+
+
+def test_intern_strings_counts_each_duplicate_once():
+    db = ygojson.Database()
+    first = "".join(["Dark ", "Magician"])
+    duplicate = "".join(["Dark ", "Magician"])
+    assert first is not duplicate
+    for character in [first, duplicate, duplicate]:
+        db.add_card(
+            ygojson.Card(
+                id=uuid.uuid4(),
+                card_type=ygojson.CardType.SKILL,
+                text={ygojson.Language.ENGLISH: ygojson.CardText(name="Skill")},
+                character=character,
+            )
+        )
+
+    assert db.intern_strings() == sys.getsizeof(duplicate)
+    assert all(card.character is first for card in db.cards)
@@ -0,0 +1,61 @@
+import datetime
+import uuid
+
+import ygojson
+
+
+def _card(legality: ygojson.CardLegality) -> ygojson.Card:
+    return ygojson.Card(
+        id=uuid.uuid4(),
+        card_type=ygojson.CardType.MONSTER,
+        text={ygojson.Language.ENGLISH: ygojson.CardText(name="Test Card")},
+        passwords=["00000001"],
+        legality={ygojson.Format.GENESYS: legality},
+    )
+
+
+def test_legality_before_first_period_is_unlimited():
+    db = ygojson.Database()
+    card = _card(
+        ygojson.CardLegality(
+            points=30,
+            history=[ygojson.LegalityPeriod(points=30, date=datetime.date(2025, 6, 1))],
+        )
+    )
+    db.add_card(card)
+
+    before = datetime.date(2025, 1, 1)
+    assert db.legality_at(card, ygojson.Format.GENESYS, before) == (
+        ygojson.Legality.UNLIMITED
+    )
+    assert db.points_at(card, ygojson.Format.GENESYS, before) == 0
+    assert db.points_at(card, ygojson.Format.GENESYS, datetime.date(2025, 7, 1)) == 30
+
+
+def test_legality_outside_format_is_none():
+    db = ygojson.Database()
+    card = _card(ygojson.CardLegality())
+    db.add_card(card)
+
+    assert db.legality_at(card, ygojson.Format.TCG, datetime.date(2025, 1, 1)) is None
+
+
+def test_no_points_before_first_period_without_points():
+    db = ygojson.Database()
+    card = _card(ygojson.CardLegality())
+    card.legality[ygojson.Format.TCG] = ygojson.CardLegality(
+        legality=ygojson.Legality.LIMITED,
+        history=[
+            ygojson.LegalityPeriod(
+                legality=ygojson.Legality.LIMITED, date=datetime.date(2025, 6, 1)
+            )
+        ],
+    )
+    db.add_card(card)
+
+    before = datetime.date(2025, 1, 1)
+    assert db.legality_at(card, ygojson.Format.TCG, before) == (
+        ygojson.Legality.UNLIMITED
+    )
+    assert db.points_at(card, ygojson.Format.TCG, before) is None
+    assert db.points_at(card, ygojson.Format.TCG, datetime.date(2025, 7, 1)) is None
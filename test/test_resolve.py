@@ -0,0 +1,20 @@
+import uuid
+
+import ygojson
+
+
+def test_resolve_identifiers_with_unicode_digits():
+    db = ygojson.Database()
+    card = ygojson.Card(
+        id=uuid.uuid4(),
+        card_type=ygojson.CardType.MONSTER,
+        text={ygojson.Language.ENGLISH: ygojson.CardText(name="Test Card")},
+        passwords=["00000123"],
+    )
+    db.add_card(card)
+
+    result = db.resolve_identifiers(["123", 123, "²", "Test Card"])
+    assert result["123"].card is card
+    assert result[123].card is card
+    assert result["²"].card is None
+    assert result["Test Card"].card is card
@@ -0,0 +1,54 @@
+import sys
+import zlib
+
+import pytest
+
+import ygojson
+
+TEXTS = {
+    "en": "When this card is Normal Summoned: You can target 1 monster in your GY; Special Summon it. "
+    * 4,
+    "ja": "このカード名の①②の効果はそれぞれ１ターンに１度しか使用できない。①：このカードが召喚に成功した時、"
+    "自分の墓地のレベル４以下のモンスター１体を対象として発動できる。そのモンスターを守備表示で特殊召喚する。"
+    "②：相手ターンに、墓地のこのカードを除外して発動できる。デッキから魔法カード１枚を手札に加える。",
+    "ko": "이 카드가 일반 소환에 성공했을 경우, 자신 묘지의 몬스터 1장을 대상으로 하고 발동할 수 있다. 그 몬스터를 특수 소환한다.",
+    "zh": "此卡召唤成功时，以自己墓地1只怪兽为对象才能发动。那只怪兽特殊召唤。这个卡名的效果1回合只能使用1次。",
+}
+
+
+@pytest.mark.parametrize("locale", TEXTS)
+def test_packed_text_is_never_bigger(locale: str):
+    text = TEXTS[locale]
+    card_text = ygojson.CardText(name="Test Card", effect=text, pendulum_effect=text)
+
+    assert card_text.effect == text
+    assert card_text.pendulum_effect == text
+    assert sys.getsizeof(card_text._effect) <= sys.getsizeof(text)
+    assert sys.getsizeof(card_text._pendulum_effect) <= sys.getsizeof(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "このカードは手札から特殊召喚できる。このカードが召喚に成功した時、自分の墓地のモンスター１体を対象として発動できる。そのモンスターを特殊召喚する。",
+        "此卡可以从手牌特殊召唤。此卡召唤成功时，以自己墓地1只怪兽为对象才能发动。那只怪兽特殊召唤。",
+    ],
+)
+def test_cjk_text_kept_as_string(text: str):
+    # UTF-8 takes 3 bytes per character here, more than the string itself,
+    # and the text is too short to compress
+    card_text = ygojson.CardText(name="Test Card", effect=text)
+
+    assert card_text._effect is text
+    assert not card_text._compressed
+
+
+def test_long_text_compressed():
+    text = TEXTS["en"]
+    card_text = ygojson.CardText(name="Test Card", effect=text)
+
+    assert card_text._effect == zlib.compress(text.encode("utf-8"))
+    assert card_text._compressed
+    card_text.effect = None
+    assert card_text.effect is None
+    assert not card_text._compressed
@@ -0,0 +1,125 @@
+import datetime
+import enum
+import threading
+import typing
+import uuid
+
+import ygojson
+
+
+def _db() -> ygojson.Database:
+    db = ygojson.Database()
+    for i in range(50):
+        db.add_card(
+            ygojson.Card(
+                id=uuid.uuid4(),
+                card_type=ygojson.CardType.MONSTER,
+                text={ygojson.Language.ENGLISH: ygojson.CardText(name=f"Card {i}")},
+                passwords=["%08u" % (i,)],
+            )
+        )
+    return db
+
+
+def _mutable_objects(root: typing.Any) -> typing.Dict[int, typing.Any]:
+    """Everything mutable reachable from root, keyed by id."""
+    found: typing.Dict[int, typing.Any] = {}
+    stack = [root]
+    while stack:
+        thing = stack.pop()
+        if id(thing) in found:
+            continue
+        if isinstance(thing, (dict, list, set)):
+            found[id(thing)] = thing
+            stack.extend(thing.keys() if isinstance(thing, dict) else thing)
+            if isinstance(thing, dict):
+                stack.extend(thing.values())
+        elif type(thing).__module__.startswith("ygojson.") and not isinstance(
+            thing, enum.Enum
+        ):
+            found[id(thing)] = thing
+            for clazz in type(thing).__mro__:
+                for slot in getattr(clazz, "__slots__", ()):
+                    if hasattr(thing, slot):
+                        stack.append(getattr(thing, slot))
+            stack.extend(getattr(thing, "__dict__", {}).values())
+    return found
+
+
+def test_copy_shares_no_objects():
+    db = _db()
+    card = db.cards[0]
+    card.legality[ygojson.Format.TCG] = ygojson.CardLegality(
+        legality=ygojson.Legality.LIMITED,
+        history=[
+            ygojson.LegalityPeriod(
+                legality=ygojson.Legality.LIMITED, date=datetime.date(2020, 1, 1)
+            )
+        ],
+    )
+    db.add_card(card)
+    locale = ygojson.SetLocale(key=ygojson.Locale.ENGLISH, language="en")
+    set_ = ygojson.Set(
+        id=uuid.uuid4(),
+        name={ygojson.Language.ENGLISH: "Test Set"},
+        locales=[locale],
+        contents=[
+            ygojson.SetContents(
+                locales=[locale],
+                cards=[ygojson.CardPrinting(id=uuid.uuid4(), card=card)],
+            )
+        ],
+    )
+    db.add_set(set_)
+
+    copy = db.copy()
+    copied_card = copy.lookup_card(ygojson.ManualFixupIdentifier(str(card.id)))
+    assert copied_card is not None and copied_card is not card
+
+    originals = _mutable_objects(db)
+    shared = [x for k, x in _mutable_objects(copy).items() if k in originals]
+    assert shared == []
+
+    copied_card.text[ygojson.Language.ENGLISH].name = "Renamed"
+    copied_card.legality[ygojson.Format.TCG].history.clear()
+    assert card.text[ygojson.Language.ENGLISH].name == "Card 0"
+    assert len(card.legality[ygojson.Format.TCG].history) == 1
+
+
+def test_update_does_not_change_current():
+    versioned = ygojson.VersionedDatabase(_db())
+    before = versioned.current
+    with versioned.update() as db:
+        db.cards[0].text[ygojson.Language.ENGLISH].name = "Renamed"
+    assert before.cards[0].text[ygojson.Language.ENGLISH].name == "Card 0"
+    assert versioned.current.cards[0].text[ygojson.Language.ENGLISH].name == "Renamed"
+
+
+def test_copy_keeps_query_cache_size():
+    db = _db()
+    db.query_cache_size = 7
+    assert db.copy().query_cache_size == 7
+
+
+def test_concurrent_queries_on_a_snapshot():
+    db = _db()
+    db.query_cache_size = 10
+    errors = []
+
+    def read():
+        try:
+            for _ in range(20):
+                for card in db.cards:
+                    mfi = ygojson.ManualFixupIdentifier(str(card.id))
+                    assert db.lookup_card(mfi) is card
+                    assert db.cards_in_locale(ygojson.Locale.ENGLISH) == []
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(db._query_cache) <= 10
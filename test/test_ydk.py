@@ -0,0 +1,44 @@
+import datetime
+import uuid
+
+import ygojson
+
+
+def test_read_ydk_skips_non_ascii_digits():
+    deck = ygojson.read_ydk(["#main", "123", "²", "!side", "456"])
+    assert deck.main == ["00000123"]
+    assert deck.side == ["00000456"]
+
+
+def test_validate_before_first_legality_period():
+    db = ygojson.Database()
+    card = ygojson.Card(
+        id=uuid.uuid4(),
+        card_type=ygojson.CardType.MONSTER,
+        text={ygojson.Language.ENGLISH: ygojson.CardText(name="Test Card")},
+        passwords=["00000123"],
+        legality={
+            ygojson.Format.GENESYS: ygojson.CardLegality(
+                points=30,
+                history=[
+                    ygojson.LegalityPeriod(points=30, date=datetime.date(2025, 6, 1))
+                ],
+            )
+        },
+    )
+    db.add_card(card)
+    deck = ygojson.Deck(main=["00000123"] * 3)
+
+    validator = ygojson.DeckValidator(
+        db, ygojson.Format.GENESYS, datetime.date(2025, 1, 1)
+    )
+    report = validator.validate(deck)
+    assert report.legal
+    assert report.points == 0
+
+    validator = ygojson.DeckValidator(
+        db, ygojson.Format.GENESYS, datetime.date(2025, 7, 1)
+    )
+    report = validator.validate(deck)
+    assert report.legal
+    assert report.points == 90